@@ -29,6 +29,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
 from api.routes.main import router as main_router
+from api.services.telephony.providers._http import close_session
 from api.services.telephony.worker_event_subscriber import (
     WorkerEventSubscriber,
     setup_worker_subscriber,
@@ -75,6 +76,7 @@ async def lifespan(app: FastAPI):
             # Fall back to immediate stop
             await worker_subscriber.stop()
 
+    await close_session()
     await redis.aclose()
 
 
@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import JSON, cast, func, literal
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload, selectinload
 
@@ -18,6 +19,18 @@ from api.enums import CallType, StorageBackend
 from api.schemas.workflow import WorkflowRunResponseSchema
 
 
+def _merge_gathered_context(patch: dict):
+    """SQL expression that merges ``patch`` into the stored ``gathered_context``.
+
+    The merge runs inside the UPDATE, so writers adding different keys at the
+    same time cannot drop each other's keys.
+    """
+    merged = cast(WorkflowRunModel.gathered_context, JSONB).op("||")(
+        literal(patch, JSONB)
+    )
+    return cast(merged, JSON)
+
+
 class WorkflowRunClient(BaseDBClient):
     async def create_workflow_run(
         self,
@@ -331,11 +344,9 @@ class WorkflowRunClient(BaseDBClient):
             if initial_context:
                 run.initial_context = initial_context
             if gathered_context:
-                # Lets merge the incoming gathered context keys with the existing ones
-                run.gathered_context = {
-                    **run.gathered_context,
-                    **gathered_context,
-                }
+                # Merge the incoming gathered context keys with the existing ones
+                # in the database rather than the copy loaded above
+                run.gathered_context = _merge_gathered_context(gathered_context)
             if logs:
                 # Lets merge the incoming logs key with existing ones
                 run.logs = {**run.logs, **logs}
@@ -351,6 +362,22 @@ class WorkflowRunClient(BaseDBClient):
             await session.refresh(run)
         return run
 
+    async def patch_workflow_run_context(self, run_id: int, patch: dict) -> None:
+        """Merge ``patch`` into the run's ``gathered_context`` in a single UPDATE.
+
+        Unlike ``update_workflow_run`` this does not load the row first, so the
+        existing context is never round-tripped through Python.
+        """
+        async with self.async_session() as session:
+            result = await session.execute(
+                WorkflowRunModel.__table__.update()
+                .where(WorkflowRunModel.id == run_id)
+                .values(gathered_context=_merge_gathered_context(patch))
+            )
+            await session.commit()
+            if result.rowcount == 0:
+                raise ValueError(f"Workflow run with ID {run_id} not found")
+
     async def update_admin_comment(
         self, run_id: int, admin_comment: str
     ) -> WorkflowRunModel:
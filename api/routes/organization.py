@@ -20,6 +20,7 @@ from api.schemas.telephony_config import (
 )
 from api.services.auth.depends import get_user
 from api.services.configuration.masking import is_mask_of, mask_key
+from api.services.telephony.factory import invalidate_telephony_config
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
 
@@ -232,6 +233,7 @@ async def save_telephony_configuration(
         OrganizationConfigurationKey.TELEPHONY_CONFIGURATION.value,
         config_value,
     )
+    invalidate_telephony_config(user.selected_organization_id)
 
     return {"message": "Telephony configuration saved successfully"}
 
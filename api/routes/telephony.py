@@ -188,9 +188,7 @@ async def initiate_call(
         "provider": provider.PROVIDER_NAME,
         **(result.provider_metadata or {}),
     }
-    await db_client.update_workflow_run(
-        run_id=workflow_run_id, gathered_context=gathered_context
-    )
+    await db_client.patch_workflow_run_context(workflow_run_id, gathered_context)
 
     response = {"message": f"Call initiated successfully with run name {workflow_run_name}"}
 
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Optional
 
@@ -81,62 +82,93 @@ class CampaignCallDispatcher:
             logger.info(f"No more queued runs for campaign {campaign_id}")
             return 0
 
-        processed_count = 0
-        for queued_run in queued_runs:
-            try:
-                # Apply rate limiting
-                await self.apply_rate_limit(
-                    campaign.organization_id, campaign.rate_limit_per_second
+        # Runs take their concurrent slot and rate-limit token one at a time,
+        # in queue order, so scheduled retries go out first and calls stay
+        # spaced by rate_limit_per_second. The rest of each dispatch (DB
+        # writes + provider API call) then proceeds concurrently.
+        progress = _BatchProgress(base_rows=campaign.processed_rows)
+        async with asyncio.TaskGroup() as task_group:
+            for queued_run in queued_runs:
+                slot_id = None
+                try:
+                    slot_id = await self.acquire_concurrent_slot(campaign)
+                    await self.apply_rate_limit(
+                        campaign.organization_id, campaign.rate_limit_per_second
+                    )
+                except Exception as e:
+                    if slot_id:
+                        await rate_limiter.release_concurrent_slot(
+                            campaign.organization_id, slot_id
+                        )
+                    await self._mark_queued_run_failed(queued_run, e)
+                    continue
+
+                task_group.create_task(
+                    self._process_queued_run(queued_run, campaign, slot_id, progress)
                 )
 
-                # Dispatch the call
-                workflow_run = await self.dispatch_call(queued_run, campaign)
-
-                # Update queued run as processed
-                await db_client.update_queued_run(
-                    queued_run_id=queued_run.id,
-                    state="processed",
-                    workflow_run_id=workflow_run.id,
-                    processed_at=datetime.now(UTC),
-                )
+        return progress.processed
 
-                processed_count += 1
+    async def _process_queued_run(
+        self,
+        queued_run: QueuedRunModel,
+        campaign: any,
+        slot_id: str,
+        progress: "_BatchProgress",
+    ) -> None:
+        """Dispatch a single queued run and record it in the campaign progress."""
+        try:
+            # Dispatch the call
+            workflow_run = await self.dispatch_call(queued_run, campaign, slot_id)
 
-                # Update campaign processed count
-                await db_client.update_campaign(
-                    campaign_id=campaign_id, processed_rows=campaign.processed_rows + 1
-                )
+            # Update queued run as processed
+            await db_client.update_queued_run(
+                queued_run_id=queued_run.id,
+                state="processed",
+                workflow_run_id=workflow_run.id,
+                processed_at=datetime.now(UTC),
+            )
 
-            except Exception as e:
-                logger.warning(f"Error processing queued run {queued_run.id}: {e}")
+        except Exception as e:
+            await self._mark_queued_run_failed(queued_run, e)
+            return
+
+        # Update campaign processed count as each run completes, so an
+        # interrupted batch keeps the progress it made
+        async with progress.lock:
+            progress.processed += 1
+            await db_client.update_campaign(
+                campaign_id=campaign.id,
+                processed_rows=progress.base_rows + progress.processed,
+            )
 
-                # Mark the queued run as failed to prevent infinite retry loops
-                try:
-                    await db_client.update_queued_run(
-                        queued_run_id=queued_run.id,
-                        state="failed",
-                        processed_at=datetime.now(UTC),
-                    )
-                    logger.info(
-                        f"Marked queued run {queued_run.id} as failed due to error: {e}"
-                    )
-                except Exception as update_error:
-                    logger.error(
-                        f"Failed to mark queued run {queued_run.id} as failed: {update_error}"
-                    )
+    async def _mark_queued_run_failed(
+        self, queued_run: QueuedRunModel, error: Exception
+    ) -> None:
+        logger.warning(f"Error processing queued run {queued_run.id}: {error}")
 
-        return processed_count
+        # Mark the queued run as failed to prevent infinite retry loops
+        try:
+            await db_client.update_queued_run(
+                queued_run_id=queued_run.id,
+                state="failed",
+                processed_at=datetime.now(UTC),
+            )
+            logger.info(
+                f"Marked queued run {queued_run.id} as failed due to error: {error}"
+            )
+        except Exception as update_error:
+            logger.error(
+                f"Failed to mark queued run {queued_run.id} as failed: {update_error}"
+            )
 
-    async def dispatch_call(
-        self, queued_run: QueuedRunModel, campaign: any
-    ) -> Optional[WorkflowRunModel]:
-        """Creates workflow run and initiates call with concurrent limiting"""
+    async def acquire_concurrent_slot(self, campaign: any) -> str:
+        """Waits until a concurrent call slot is free for the campaign's organization"""
         # Get concurrent limit for organization
         max_concurrent = await self.get_org_concurrent_limit(campaign.organization_id)
 
         # Track wait time for alerting
         wait_start = time.time()
-        slot_id = None
 
         # Wait until we can acquire a concurrent slot
         while True:
@@ -144,7 +176,7 @@ class CampaignCallDispatcher:
                 campaign.organization_id, max_concurrent
             )
             if slot_id:
-                break
+                return slot_id
 
             # Check if we've been waiting too long
             wait_time = time.time() - wait_start
@@ -161,6 +193,10 @@ class CampaignCallDispatcher:
             # Wait before retrying
             await asyncio.sleep(1)
 
+    async def dispatch_call(
+        self, queued_run: QueuedRunModel, campaign: any, slot_id: str
+    ) -> Optional[WorkflowRunModel]:
+        """Creates workflow run and initiates call using an acquired concurrent slot"""
         # Get workflow details
         workflow = await db_client.get_workflow_by_id(campaign.workflow_id)
         if not workflow:
@@ -247,9 +283,9 @@ class CampaignCallDispatcher:
 
             # Store provider type and metadata in gathered_context
             # (required for WebSocket handler to route to correct provider)
-            await db_client.update_workflow_run(
-                run_id=workflow_run.id,
-                gathered_context={
+            await db_client.patch_workflow_run_context(
+                workflow_run.id,
+                {
                     "provider": provider.PROVIDER_NAME,
                     **(call_result.provider_metadata or {}),
                 },
@@ -346,5 +382,14 @@ class CampaignCallDispatcher:
         return False
 
 
+@dataclass
+class _BatchProgress:
+    """Runs processed so far in one batch, on top of the campaign's prior count"""
+
+    base_rows: int
+    processed: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
 # Global instance
 campaign_call_dispatcher = CampaignCallDispatcher()
@@ -1,11 +1,19 @@
+import base64
+import hashlib
+import hmac
+import json
 import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Optional
 
-import jwt
+# base64url of {"alg":"HS256","typ":"JWT"}; the header never changes
+_JWT_HEADER_SEGMENT = b"eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
 
 
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 
 @dataclass(frozen=True)
 class LiveKitTokenConfig:
@@ -13,12 +21,31 @@ class LiveKitTokenConfig:
     api_secret: str
     url: str
 
+
 class LiveKitTokenService:
     def __init__(self, config: LiveKitTokenConfig) -> None:
         self._config = config
+        # Keyed once; each token copies it instead of re-deriving the key pads
+        self._hmac_template = hmac.new(
+            config.api_secret.encode("utf-8"), digestmod=hashlib.sha256
+        )
+
+    def _sign(self, payload: dict) -> str:
+        # HS256 JWT: base64url(header).base64url(payload).base64url(signature)
+        signing_input = (
+            _JWT_HEADER_SEGMENT
+            + b"."
+            + _b64url(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        )
+        mac = self._hmac_template.copy()
+        mac.update(signing_input)
+        signature = mac.digest()
+        return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
     @classmethod
-    def from_values(cls, api_key: str, api_secret: str, url: str) -> "LiveKitTokenService":
+    def from_values(
+        cls, api_key: str, api_secret: str, url: str
+    ) -> "LiveKitTokenService":
         if not api_key or not api_secret or not url:
             raise ValueError("LiveKit configuration values are missing")
         config = LiveKitTokenConfig(api_key=api_key, api_secret=api_secret, url=url)
@@ -56,7 +83,7 @@ class LiveKitTokenService:
             },
         }
 
-        token = jwt.encode(payload, self._config.api_secret, algorithm="HS256")
+        token = self._sign(payload)
         return token, identity_value
 
     @property
@@ -68,6 +68,8 @@ from pipecat.utils.tracing.context_registry import ContextProviderRegistry
 # Setup tracing if enabled
 setup_pipeline_tracing()
 
+NODE_TRANSITION_EVENT_TYPE = "rtf-node-transition"
+
 
 async def run_pipeline_twilio(
     websocket_client: WebSocket,
@@ -83,12 +85,13 @@ async def run_pipeline_twilio(
     )
     set_current_run_id(workflow_run_id)
 
-    # Store call ID in cost_info for later cost calculation (provider-agnostic)
+    # Store call ID in cost_info for later cost calculation (provider-agnostic),
+    # while fetching the workflow to extract all pipeline configurations
     cost_info = {"call_id": call_sid}
-    await db_client.update_workflow_run(workflow_run_id, cost_info=cost_info)
-
-    # Get workflow to extract all pipeline configurations
-    workflow = await db_client.get_workflow(workflow_id, user_id)
+    _, workflow = await asyncio.gather(
+        db_client.update_workflow_run(workflow_run_id, cost_info=cost_info),
+        db_client.get_workflow(workflow_id, user_id),
+    )
     vad_config = None
     ambient_noise_config = None
     if workflow and workflow.workflow_configurations:
@@ -202,9 +205,10 @@ async def run_pipeline_vobiz(
     set_current_run_id(workflow_run_id)
 
     cost_info = {"call_id": call_id}
-    await db_client.update_workflow_run(workflow_run_id, cost_info=cost_info)
-
-    workflow = await db_client.get_workflow(workflow_id, user_id)
+    _, workflow = await asyncio.gather(
+        db_client.update_workflow_run(workflow_run_id, cost_info=cost_info),
+        db_client.get_workflow(workflow_id, user_id),
+    )
     vad_config = None
     ambient_noise_config = None
     if workflow and workflow.workflow_configurations:
@@ -264,12 +268,15 @@ async def run_pipeline_cloudonix(
     )
     set_current_run_id(workflow_run_id)
 
-    # Store call ID in cost_info for later cost calculation (provider-agnostic)
+    # Store call ID in cost_info for later cost calculation (provider-agnostic),
+    # while fetching the workflow for its pipeline configurations and the
+    # workflow run for its session token
     cost_info = {"call_id": call_sid}
-    await db_client.update_workflow_run(workflow_run_id, cost_info=cost_info)
-
-    # Get workflow to extract all pipeline configurations
-    workflow = await db_client.get_workflow(workflow_id, user_id)
+    _, workflow, workflow_run = await asyncio.gather(
+        db_client.update_workflow_run(workflow_run_id, cost_info=cost_info),
+        db_client.get_workflow(workflow_id, user_id),
+        db_client.get_workflow_run(workflow_run_id),
+    )
     vad_config = None
     ambient_noise_config = None
     if workflow and workflow.workflow_configurations:
@@ -281,7 +288,6 @@ async def run_pipeline_cloudonix(
             ]
 
     # Retrieve session_token from workflow_run gathered_context
-    workflow_run = await db_client.get_workflow_run(workflow_run_id)
     session_token = None
     if workflow_run and workflow_run.gathered_context:
         session_token = workflow_run.gathered_context.get("session_token")
@@ -519,8 +525,11 @@ async def _run_pipeline(
     # Create in-memory logs buffer early so it can be used by engine callbacks
     in_memory_logs_buffer = InMemoryLogsBuffer(workflow_run_id)
 
-    # Create node transition callback if WebSocket sender is available
+    # Real-time feedback (node transitions and the feedback observer) is only
+    # wired up when a WebSocket sender is registered for this run. Both are set
+    # up together from a single lookup so they can never disagree.
     node_transition_callback = None
+    feedback_observer = None
     ws_sender = get_ws_sender(workflow_run_id)
     if ws_sender:
 
@@ -529,11 +538,8 @@ async def _run_pipeline(
         ) -> None:
             """Send node transition event via WebSocket AND log to buffer."""
             message = {
-                "type": "rtf-node-transition",
-                "payload": {
-                    "node_name": node_name,
-                    "previous_node": previous_node,
-                },
+                "type": NODE_TRANSITION_EVENT_TYPE,
+                "payload": {"node_name": node_name, "previous_node": previous_node},
             }
             # Send via WebSocket
             try:
@@ -548,6 +554,10 @@ async def _run_pipeline(
                 logger.error(f"Failed to append node transition to logs buffer: {e}")
 
         node_transition_callback = send_node_transition
+        feedback_observer = RealtimeFeedbackObserver(
+            ws_sender=ws_sender,
+            logs_buffer=in_memory_logs_buffer,
+        )
 
     # Extract embeddings configuration from user config
     embeddings_api_key = None
@@ -675,13 +685,7 @@ async def _run_pipeline(
         )
     )
 
-    # Add real-time feedback observer if WebSocket sender is available
-    # Note: ws_sender was already fetched earlier for node_transition_callback
-    if ws_sender:
-        feedback_observer = RealtimeFeedbackObserver(
-            ws_sender=ws_sender,
-            logs_buffer=in_memory_logs_buffer,
-        )
+    if feedback_observer:
         task.add_observer(feedback_observer)
 
     register_task_event_handler(
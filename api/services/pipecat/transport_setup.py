@@ -1,53 +1,211 @@
 import os
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
 
 from fastapi import WebSocket
+from loguru import logger
 
 from api.constants import APP_ROOT_DIR, ENABLE_RNNOISE, ENABLE_SMART_TURN
-from api.db import db_client
-from api.enums import OrganizationConfigurationKey
-from api.services.looptalk.internal_transport import InternalTransport
 from api.services.pipecat.audio_config import AudioConfig
-from api.services.telephony.stasis_rtp_connection import StasisRTPConnection
-from api.services.telephony.stasis_rtp_serializer import StasisRTPFrameSerializer
-from api.services.telephony.stasis_rtp_transport import (
-    StasisRTPTransport,
-    StasisRTPTransportParams,
-)
+from api.services.telephony.config import load_telephony_config
 from pipecat.audio.filters.rnnoise_filter import RNNoiseFilter
 from pipecat.audio.mixers.silence_mixer import SilenceAudioMixer
 from pipecat.audio.mixers.soundfile_mixer import SoundfileMixer
-from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
 from pipecat.audio.vad.silero import SileroVADAnalyzer, VADParams
-from pipecat.serializers.twilio import TwilioFrameSerializer
-from pipecat.serializers.vobiz import VobizFrameSerializer
-from pipecat.serializers.vonage import VonageFrameSerializer
 from pipecat.transports.base_transport import TransportParams
-from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
-from pipecat.transports.smallwebrtc.transport import SmallWebRTCTransport
 from pipecat.transports.websocket.fastapi import (
     FastAPIWebsocketParams,
     FastAPIWebsocketTransport,
 )
 
+if TYPE_CHECKING:
+    from api.services.telephony.stasis_rtp_connection import StasisRTPConnection
+    from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
+
+# Transport, serializer and turn analyzer classes that only some deployments
+# use are imported inside their factories, so a worker only pays for the
+# transports it actually serves.
+
 librnnoise_path = os.path.normpath(
     str(APP_ROOT_DIR / "native" / "rnnoise" / "librnnoise.so")
 )
 
+# Ambient noise recordings shipped in assets/, keyed by sample rate
+_AMBIENCE_PATHS = {
+    rate: APP_ROOT_DIR / "assets" / f"office-ambience-{rate}-mono.wav"
+    for rate in (8000, 16000)
+}
+
+
+@lru_cache(maxsize=32)
+def _vad_params(
+    confidence: float, start_secs: float, stop_secs: float, min_volume: float
+) -> VADParams:
+    return VADParams(
+        confidence=confidence,
+        start_secs=start_secs,
+        stop_secs=stop_secs,
+        min_volume=min_volume,
+    )
+
+
+def _normalize_vad(vad_config: dict | None) -> VADParams | None:
+    """Resolve a workflow VAD config to shared VADParams.
+
+    Returns None when no config is set so pipecat's own defaults apply.
+    """
+    if not vad_config:
+        return None
+
+    return _vad_params(
+        vad_config.get("confidence", 0.7),
+        vad_config.get("start_seconds", 0.4),
+        vad_config.get("stop_seconds", 0.8),
+        vad_config.get("minimum_volume", 0.6),
+    )
+
+
+def _normalize_ambient_noise(ambient_noise_config: dict | None) -> float | None:
+    """Return the ambient noise volume, or None when ambient noise is disabled."""
+    if not ambient_noise_config or not ambient_noise_config.get("enabled", False):
+        return None
+
+    return ambient_noise_config.get("volume", 0.3)
+
+
+def create_vad_analyzer(vad_config: dict | None) -> SileroVADAnalyzer:
+    """Create a Silero VAD analyzer for a single transport.
+
+    The analyzer keeps per-stream state (audio buffer, speech state machine,
+    model RNN state), so a new instance is needed for every call. Only the
+    immutable VADParams are shared between calls with the same settings. The
+    sample rate is set later by the transport.
+
+    Args:
+        vad_config: Optional workflow VAD configuration
+    """
+    return SileroVADAnalyzer(params=_normalize_vad(vad_config))
+
+
+def create_audio_out_mixer(ambient_noise_config: dict | None, sample_rate: int):
+    """Create the output mixer for a single transport.
+
+    Mixers track their playback position and load the sound files on start,
+    so each call gets its own instance.
+
+    Args:
+        ambient_noise_config: Optional workflow ambient noise configuration
+        sample_rate: Transport output sample rate, used to pick the sound file
+    """
+    volume = _normalize_ambient_noise(ambient_noise_config)
+    if volume is None:
+        return SilenceAudioMixer()
+
+    office_path = _AMBIENCE_PATHS.get(sample_rate) or (
+        APP_ROOT_DIR / "assets" / f"office-ambience-{sample_rate}-mono.wav"
+    )
+    return SoundfileMixer(
+        sound_files={"office": office_path},
+        default_sound="office",
+        volume=volume,
+    )
+
+
+def create_audio_in_filter():
+    """Create the input noise filter for a single transport, if enabled.
+
+    RNNoise keeps denoiser state per stream, so the filter is not shared
+    between calls. The shared library itself is only loaded once per process
+    by the dynamic loader.
+    """
+    if ENABLE_RNNOISE:
+        return RNNoiseFilter(library_path=librnnoise_path)
+
+    return None
+
+
+@cache
+def _smart_turn_params():
+    from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
+
+    return SmartTurnParams()
+
 
 def create_turn_analyzer(workflow_run_id: int, audio_config: AudioConfig):
-    """Create a turn analyzer backed by the local Smart Turn HTTP service.
+    """Create a Smart Turn v3 analyzer for a single transport, if enabled.
+
+    The analyzer buffers the current turn's audio and speech state, so every
+    call gets its own instance. Only the default SmartTurnParams are shared.
 
     Args:
         workflow_run_id: ID of the workflow run for turn analyzer context
         audio_config: Audio configuration containing pipeline sample rate
     """
     if ENABLE_SMART_TURN:
-        return LocalSmartTurnAnalyzerV3(params=SmartTurnParams())
+        from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import (
+            LocalSmartTurnAnalyzerV3,
+        )
+
+        return LocalSmartTurnAnalyzerV3(params=_smart_turn_params())
 
     return None
 
 
+# Credentials each telephony transport needs from the organization config
+_REQUIRED_CONFIG_FIELDS: dict[str, tuple[str, ...]] = {
+    "twilio": ("account_sid", "auth_token"),
+    "cloudonix": ("bearer_token", "domain_id"),
+    "vonage": ("application_id", "private_key"),
+    "vobiz": ("auth_id", "auth_token"),
+}
+
+
+def _require(config: dict, provider: str, organization_id: int) -> None:
+    """Ensure the telephony config is for ``provider`` and has its credentials."""
+    if config.get("provider") != provider:
+        raise ValueError(f"Expected {provider} provider, got {config.get('provider')}")
+
+    missing = [f for f in _REQUIRED_CONFIG_FIELDS[provider] if not config.get(f)]
+    if missing:
+        raise ValueError(
+            f"Incomplete {provider} configuration for organization "
+            f"{organization_id}. Missing: {', '.join(missing)}"
+        )
+
+
+def _common_params_kwargs(
+    workflow_run_id: int,
+    audio_config: AudioConfig,
+    vad_config: dict | None,
+    ambient_noise_config: dict | None,
+) -> dict:
+    """Build the transport params shared by every transport factory.
+
+    Each factory passes these into its own params class together with any
+    transport specific settings (serializer, chunking, channels).
+    """
+    out_sample_rate = audio_config.transport_out_sample_rate
+    params = {
+        "audio_in_enabled": True,
+        "audio_out_enabled": True,
+        "audio_in_sample_rate": audio_config.transport_in_sample_rate,
+        "audio_out_sample_rate": out_sample_rate,
+        "vad_analyzer": create_vad_analyzer(vad_config),
+        "audio_out_mixer": create_audio_out_mixer(
+            ambient_noise_config, out_sample_rate
+        ),
+    }
+
+    # Optional processors are only added when enabled; the params classes
+    # default them to None
+    if ENABLE_SMART_TURN:
+        params["turn_analyzer"] = create_turn_analyzer(workflow_run_id, audio_config)
+    if ENABLE_RNNOISE:
+        params["audio_in_filter"] = create_audio_in_filter()
+
+    return params
+
+
 async def create_twilio_transport(
     websocket_client: WebSocket,
     stream_sid: str,
@@ -61,69 +219,25 @@ async def create_twilio_transport(
     """Create a transport for Twilio connections"""
 
     # Fetch Twilio credentials from organization config
-    config = await db_client.get_configuration(
-        organization_id, OrganizationConfigurationKey.TELEPHONY_CONFIGURATION.value
-    )
-
-    if not config or not config.value:
-        raise ValueError(
-            f"Twilio credentials not configured for organization {organization_id}"
-        )
-
-    account_sid = config.value.get("account_sid")
-    auth_token = config.value.get("auth_token")
-
-    if not account_sid or not auth_token:
-        raise ValueError(
-            f"Incomplete Twilio configuration for organization {organization_id}"
-        )
+    config = await load_telephony_config(organization_id)
+    _require(config, "twilio", organization_id)
 
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
+    from pipecat.serializers.twilio import TwilioFrameSerializer
 
     serializer = TwilioFrameSerializer(
         stream_sid=stream_sid,
         call_sid=call_sid,
-        account_sid=account_sid,
-        auth_token=auth_token,
+        account_sid=config["account_sid"],
+        auth_token=config["auth_token"],
     )
 
     return FastAPIWebsocketTransport(
         websocket=websocket_client,
         params=FastAPIWebsocketParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
-            ),  # Sample rate will be set by transport
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
             ),
-            turn_analyzer=turn_analyzer,
             serializer=serializer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
     )
 
@@ -142,71 +256,26 @@ async def create_cloudonix_transport(
     """Create a transport for Cloudonix connections"""
 
     # Load Cloudonix configuration from database
-    from api.services.telephony.factory import load_telephony_config
-
     config = await load_telephony_config(organization_id)
-
-    if config.get("provider") != "cloudonix":
-        raise ValueError(f"Expected Cloudonix provider, got {config.get('provider')}")
-
-    bearer_token = config.get("bearer_token")
-    domain_id = config.get("domain_id")
-
-    if not bearer_token or not domain_id:
-        raise ValueError(
-            f"Incomplete Cloudonix configuration for organization {organization_id}. "
-            f"Required: bearer_token, domain_id"
-        )
-
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
+    _require(config, "cloudonix", organization_id)
 
     from pipecat.serializers.cloudonix import CloudonixFrameSerializer
 
     serializer = CloudonixFrameSerializer(
         stream_sid=stream_sid,
         call_sid=call_sid,
-        domain_id=domain_id,
-        bearer_token=bearer_token,
+        domain_id=config["domain_id"],
+        bearer_token=config["bearer_token"],
         session_token=session_token,
     )
 
     return FastAPIWebsocketTransport(
         websocket=websocket_client,
         params=FastAPIWebsocketParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
-            ),  # Sample rate will be set by transport
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
             ),
-            turn_analyzer=turn_analyzer,
             serializer=serializer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
     )
 
@@ -223,27 +292,15 @@ async def create_vonage_transport(
     """Create a transport for Vonage connections"""
 
     # Use the factory to load config from database
-    from api.services.telephony.factory import load_telephony_config
-
     config = await load_telephony_config(organization_id)
+    _require(config, "vonage", organization_id)
 
-    if config.get("provider") != "vonage":
-        raise ValueError(f"Expected Vonage provider, got {config.get('provider')}")
-
-    application_id = config.get("application_id")
-    private_key = config.get("private_key")
-
-    if not application_id or not private_key:
-        raise ValueError(
-            f"Incomplete Vonage configuration for organization {organization_id}"
-        )
-
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
+    from pipecat.serializers.vonage import VonageFrameSerializer
 
     serializer = VonageFrameSerializer(
         call_uuid=call_uuid,
-        application_id=application_id,
-        private_key=private_key,
+        application_id=config["application_id"],
+        private_key=config["private_key"],
         params=VonageFrameSerializer.InputParams(
             vonage_sample_rate=audio_config.transport_in_sample_rate,
             sample_rate=audio_config.pipeline_sample_rate,
@@ -254,40 +311,10 @@ async def create_vonage_transport(
     return FastAPIWebsocketTransport(
         websocket=websocket_client,
         params=FastAPIWebsocketParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
-            ),
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
             ),
-            turn_analyzer=turn_analyzer,
             serializer=serializer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
     )
 
@@ -309,146 +336,80 @@ async def create_vobiz_transport(
     - Base64-encoded audio in JSON messages
     - PlivoFrameSerializer handles the protocol
     """
-    from loguru import logger
-
     logger.info(
-        f"[run {workflow_run_id}] Creating Vobiz transport - "
-        f"stream_id={stream_id}, call_id={call_id}"
+        "[run {}] Creating Vobiz transport - stream_id={}, call_id={}",
+        workflow_run_id,
+        stream_id,
+        call_id,
     )
 
     # Load Vobiz configuration from database
-    from api.services.telephony.factory import load_telephony_config
-
     config = await load_telephony_config(organization_id)
-
-    if config.get("provider") != "vobiz":
-        raise ValueError(f"Expected Vobiz provider, got {config.get('provider')}")
-
-    auth_id = config.get("auth_id")
-    auth_token = config.get("auth_token")
-
-    if not auth_id or not auth_token:
-        raise ValueError(
-            f"Incomplete Vobiz configuration for organization {organization_id}"
-        )
+    _require(config, "vobiz", organization_id)
+    auth_id = config["auth_id"]
 
     logger.debug(
-        f"[run {workflow_run_id}] Vobiz config loaded - auth_id={auth_id}, "
-        f"from_numbers={len(config.get('from_numbers', []))} numbers"
+        "[run {}] Vobiz config loaded - auth_id={}, from_numbers={} numbers",
+        workflow_run_id,
+        auth_id,
+        len(config.get("from_numbers", [])),
     )
 
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
-
     # Use VobizFrameSerializer for Vobiz WebSocket protocol
+    from pipecat.serializers.vobiz import VobizFrameSerializer
+
+    pipeline_sample_rate = audio_config.pipeline_sample_rate
     serializer = VobizFrameSerializer(
         stream_id=stream_id,
         call_id=call_id,
         auth_id=auth_id,
-        auth_token=auth_token,
+        auth_token=config["auth_token"],
         params=VobizFrameSerializer.InputParams(
             vobiz_sample_rate=8000,  # Vobiz uses MULAW at 8kHz
-            sample_rate=audio_config.pipeline_sample_rate,
+            sample_rate=pipeline_sample_rate,
         ),
     )
 
     logger.debug(
-        f"[run {workflow_run_id}] VobizFrameSerializer created for Vobiz - "
-        f"transport_rate=8000Hz, pipeline_rate={audio_config.pipeline_sample_rate}Hz"
+        "[run {}] VobizFrameSerializer created for Vobiz - "
+        "transport_rate=8000Hz, pipeline_rate={}Hz",
+        workflow_run_id,
+        pipeline_sample_rate,
     )
 
     # Create WebSocket transport (same structure as Twilio/Vonage)
     transport = FastAPIWebsocketTransport(
         websocket=websocket_client,
         params=FastAPIWebsocketParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
             ),
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
-            ),
-            turn_analyzer=turn_analyzer,
             serializer=serializer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
     )
 
     logger.info(
-        f"[run {workflow_run_id}] Vobiz transport created successfully (VAD enabled)"
+        "[run {}] Vobiz transport created successfully (VAD enabled)", workflow_run_id
     )
     return transport
 
 
 def create_webrtc_transport(
-    webrtc_connection: SmallWebRTCConnection,
+    webrtc_connection: "SmallWebRTCConnection",
     workflow_run_id: int,
     audio_config: AudioConfig,
     vad_config: dict | None = None,
     ambient_noise_config: dict | None = None,
 ):
     """Create a transport for WebRTC connections"""
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
+    from pipecat.transports.smallwebrtc.transport import SmallWebRTCTransport
 
     return SmallWebRTCTransport(
         webrtc_connection=webrtc_connection,
         params=TransportParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
-            ),  # Sample rate will be set by transport
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
             ),
-            turn_analyzer=turn_analyzer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
     )
 
@@ -465,59 +426,31 @@ def create_livekit_transport(
     """Create a transport for LiveKit connections."""
     from pipecat.transports.livekit.transport import LiveKitParams, LiveKitTransport
 
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
-
     return LiveKitTransport(
         url=url,
         token=token,
         room_name=room_name,
         params=LiveKitParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
-            ),
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
             ),
-            turn_analyzer=turn_analyzer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
     )
 
 
 def create_stasis_transport(
-    stasis_connection: StasisRTPConnection,
+    stasis_connection: "StasisRTPConnection",
     workflow_run_id: int,
     audio_config: AudioConfig,
     vad_config: dict | None = None,
     ambient_noise_config: dict | None = None,
 ):
     """Create a transport for ARI connections"""
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
+    from api.services.telephony.stasis_rtp_serializer import StasisRTPFrameSerializer
+    from api.services.telephony.stasis_rtp_transport import (
+        StasisRTPTransport,
+        StasisRTPTransportParams,
+    )
 
     serializer = StasisRTPFrameSerializer(
         StasisRTPFrameSerializer.InputParams(
@@ -528,41 +461,11 @@ def create_stasis_transport(
     return StasisRTPTransport(
         stasis_connection,
         params=StasisRTPTransportParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
-            audio_out_10ms_chunks=2,  # Send 20ms packets
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
-            ),  # Sample rate will be set by transport
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
             ),
-            turn_analyzer=turn_analyzer,
+            audio_out_10ms_chunks=2,  # Send 20ms packets
             serializer=serializer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
     )
 
@@ -584,46 +487,16 @@ def create_internal_transport(
     Returns:
         InternalTransport instance configured with turn analyzer
     """
-    turn_analyzer = create_turn_analyzer(workflow_run_id, audio_config)
+    from api.services.looptalk.internal_transport import InternalTransport
 
     # Create and return the internal transport with latency
     return InternalTransport(
         params=TransportParams(
-            audio_out_enabled=True,
-            audio_out_sample_rate=audio_config.transport_out_sample_rate,
+            **_common_params_kwargs(
+                workflow_run_id, audio_config, vad_config, ambient_noise_config
+            ),
             audio_out_channels=1,
-            audio_in_enabled=True,
-            audio_in_sample_rate=audio_config.transport_in_sample_rate,
             audio_in_channels=1,
-            vad_analyzer=(
-                SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=vad_config.get("confidence", 0.7),
-                        start_secs=vad_config.get("start_seconds", 0.4),
-                        stop_secs=vad_config.get("stop_seconds", 0.8),
-                        min_volume=vad_config.get("minimum_volume", 0.6),
-                    )
-                )
-                if vad_config
-                else SileroVADAnalyzer()
-            ),
-            audio_out_mixer=(
-                SoundfileMixer(
-                    sound_files={
-                        "office": APP_ROOT_DIR
-                        / "assets"
-                        / f"office-ambience-{audio_config.transport_out_sample_rate}-mono.wav"
-                    },
-                    default_sound="office",
-                    volume=ambient_noise_config.get("volume", 0.3),
-                )
-                if ambient_noise_config and ambient_noise_config.get("enabled", False)
-                else SilenceAudioMixer()
-            ),
-            turn_analyzer=turn_analyzer,
-            audio_in_filter=RNNoiseFilter(library_path=librnnoise_path)
-            if ENABLE_RNNOISE
-            else None,
         ),
         latency_seconds=latency_seconds,
     )
@@ -6,12 +6,27 @@ while keeping business logic decoupled from specific implementations.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
 
+def first_truthy(
+    data: Mapping[str, Any], keys: Tuple[str, ...], default: Any = None
+) -> Any:
+    """Return the first truthy value found under ``keys`` in ``data``.
+
+    Providers report the same field under different names depending on the
+    payload (REST response, status callback, TwiML-style webhook).
+    """
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
 @dataclass
 class CallInitiationResult:
     """Standardized response from initiate_call across all providers."""
@@ -48,6 +63,9 @@ class TelephonyProvider(ABC):
     All telephony providers must implement these core methods.
     """
 
+    # Empty so subclasses that declare __slots__ get no per-instance __dict__
+    __slots__ = ()
+
     PROVIDER_NAME = None
     WEBHOOK_ENDPOINT = None
 
@@ -0,0 +1,113 @@
+"""
+Telephony configuration loading.
+
+Kept separate from the provider factory so that modules which only need the
+stored credentials (e.g. transport setup) don't import every provider class.
+"""
+
+import time
+from typing import Any, Dict, Tuple
+
+from loguru import logger
+
+from api.db import db_client
+from api.enums import OrganizationConfigurationKey
+
+# Telephony config is read on every call setup, so keep it in-process for a
+# short while. Saving the config through the API invalidates the entry only in
+# the process that handled the save. Every other API and ARQ worker keeps its
+# cached copy until the entry expires, so after a credential rotation (e.g. a
+# new auth_token or api_secret) those workers can place calls with the old
+# credentials and reject correctly signed webhooks for up to this many seconds.
+TELEPHONY_CONFIG_CACHE_TTL_SECONDS = 60.0
+
+_config_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+# Credential fields copied out of the stored configuration for each provider
+_PROVIDER_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "twilio": ("account_sid", "auth_token", "from_numbers"),
+    "vonage": (
+        "application_id",
+        "private_key",
+        "api_key",
+        "api_secret",
+        "from_numbers",
+    ),
+    "vobiz": ("auth_id", "auth_token", "from_numbers"),
+    # api_key is used for x-cx-apikey validation
+    "cloudonix": ("bearer_token", "api_key", "domain_id", "from_numbers"),
+    "livekit": ("api_key", "api_secret", "url", "sip_trunk_id", "sip_call_to"),
+}
+
+
+def invalidate_cached_telephony_config(organization_id: int) -> None:
+    """Drop the cached telephony configuration for an organization."""
+    _config_cache.pop(organization_id, None)
+
+
+async def load_telephony_config(organization_id: int) -> Dict[str, Any]:
+    """
+    Load telephony configuration from database.
+
+    Results are cached per organization for TELEPHONY_CONFIG_CACHE_TTL_SECONDS.
+    The cache is per process; see the note on that constant.
+
+    Args:
+        organization_id: Organization ID for database config
+
+    Returns:
+        Configuration dictionary with provider type and credentials
+
+    Raises:
+        ValueError: If no configuration found for the organization
+    """
+    if not organization_id:
+        raise ValueError("Organization ID is required to load telephony configuration")
+
+    cached = _config_cache.get(organization_id)
+    if cached and cached[0] > time.monotonic():
+        return _copy_config(cached[1])
+
+    config = await _fetch_telephony_config(organization_id)
+    _config_cache[organization_id] = (
+        time.monotonic() + TELEPHONY_CONFIG_CACHE_TTL_SECONDS,
+        config,
+    )
+    return _copy_config(config)
+
+
+def _copy_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    # Callers own the returned dict, including the from_numbers list, so
+    # changes they make never reach the cached entry
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in config.items()
+    }
+
+
+async def _fetch_telephony_config(organization_id: int) -> Dict[str, Any]:
+    logger.debug("Loading telephony config from database for org {}", organization_id)
+
+    config = await db_client.get_configuration(
+        organization_id,
+        OrganizationConfigurationKey.TELEPHONY_CONFIGURATION.value,
+    )
+
+    if config and config.value:
+        # Simple single-provider format
+        provider = config.value.get("provider", "twilio")
+
+        fields = _PROVIDER_FIELDS.get(provider)
+        if fields is None:
+            raise ValueError(f"Unknown provider in config: {provider}")
+
+        telephony_config = {"provider": provider}
+        for field in fields:
+            telephony_config[field] = config.value.get(
+                field, [] if field == "from_numbers" else None
+            )
+        return telephony_config
+
+    raise ValueError(
+        f"No telephony configuration found for organization {organization_id}"
+    )
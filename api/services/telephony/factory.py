@@ -4,99 +4,51 @@ Handles configuration loading from environment (OSS) or database (SaaS).
 The providers themselves don't know or care where config comes from.
 """
 
-from typing import Any, Dict, List, Type
+import time
+from typing import Any, Dict, List, Tuple, Type
 
 from loguru import logger
 
-from api.db import db_client
-from api.enums import OrganizationConfigurationKey
 from api.services.telephony.base import TelephonyProvider
+from api.services.telephony.config import (
+    TELEPHONY_CONFIG_CACHE_TTL_SECONDS,
+    invalidate_cached_telephony_config,
+    load_telephony_config,
+)
 from api.services.telephony.providers.cloudonix_provider import CloudonixProvider
 from api.services.telephony.providers.livekit_provider import LiveKitProvider
 from api.services.telephony.providers.twilio_provider import TwilioProvider
 from api.services.telephony.providers.vobiz_provider import VobizProvider
 from api.services.telephony.providers.vonage_provider import VonageProvider
 
+# Provider instances are reused per organization while the loaded configuration
+# is unchanged, for at most TELEPHONY_CONFIG_CACHE_TTL_SECONDS. Providers keep
+# state fetched from their APIs (e.g. Cloudonix DNIDs), so the TTL bounds how
+# long that state can go stale.
+_provider_cache: Dict[int, Tuple[float, Dict[str, Any], TelephonyProvider]] = {}
 
-async def load_telephony_config(organization_id: int) -> Dict[str, Any]:
-    """
-    Load telephony configuration from database.
-
-    Args:
-        organization_id: Organization ID for database config
-
-    Returns:
-        Configuration dictionary with provider type and credentials
+_PROVIDER_CLASSES: Dict[str, Type[TelephonyProvider]] = {
+    "twilio": TwilioProvider,
+    "vonage": VonageProvider,
+    "vobiz": VobizProvider,
+    "cloudonix": CloudonixProvider,
+    "livekit": LiveKitProvider,
+}
 
-    Raises:
-        ValueError: If no configuration found for the organization
-    """
-    if not organization_id:
-        raise ValueError("Organization ID is required to load telephony configuration")
-
-    logger.debug(f"Loading telephony config from database for org {organization_id}")
-
-    config = await db_client.get_configuration(
-        organization_id,
-        OrganizationConfigurationKey.TELEPHONY_CONFIGURATION.value,
-    )
 
-    if config and config.value:
-        # Simple single-provider format
-        provider = config.value.get("provider", "twilio")
-
-        if provider == "twilio":
-            return {
-                "provider": "twilio",
-                "account_sid": config.value.get("account_sid"),
-                "auth_token": config.value.get("auth_token"),
-                "from_numbers": config.value.get("from_numbers", []),
-            }
-        elif provider == "vonage":
-            return {
-                "provider": "vonage",
-                "application_id": config.value.get("application_id"),
-                "private_key": config.value.get("private_key"),
-                "api_key": config.value.get("api_key"),
-                "api_secret": config.value.get("api_secret"),
-                "from_numbers": config.value.get("from_numbers", []),
-            }
-        elif provider == "vobiz":
-            return {
-                "provider": "vobiz",
-                "auth_id": config.value.get("auth_id"),
-                "auth_token": config.value.get("auth_token"),
-                "from_numbers": config.value.get("from_numbers", []),
-            }
-        elif provider == "cloudonix":
-            return {
-                "provider": "cloudonix",
-                "bearer_token": config.value.get("bearer_token"),
-                "api_key": config.value.get("api_key"),  # For x-cx-apikey validation
-                "domain_id": config.value.get("domain_id"),
-                "from_numbers": config.value.get("from_numbers", []),
-            }
-        elif provider == "livekit":
-            return {
-                "provider": "livekit",
-                "api_key": config.value.get("api_key"),
-                "api_secret": config.value.get("api_secret"),
-                "url": config.value.get("url"),
-                "sip_trunk_id": config.value.get("sip_trunk_id"),
-                "sip_call_to": config.value.get("sip_call_to"),
-            }
-        else:
-            raise ValueError(f"Unknown provider in config: {provider}")
-
-    raise ValueError(
-        f"No telephony configuration found for organization {organization_id}"
-    )
+def invalidate_telephony_config(organization_id: int) -> None:
+    """Drop the cached telephony configuration and provider for an organization."""
+    invalidate_cached_telephony_config(organization_id)
+    _provider_cache.pop(organization_id, None)
 
 
 async def get_telephony_provider(organization_id: int) -> TelephonyProvider:
     """
     Factory function to create telephony providers.
 
+    The provider instance is reused for an organization until its
+    configuration changes or TELEPHONY_CONFIG_CACHE_TTL_SECONDS pass.
+
     Args:
         organization_id: Organization ID (required)
 
@@ -109,28 +61,26 @@ async def get_telephony_provider(organization_id: int) -> TelephonyProvider:
     # Load configuration
     config = await load_telephony_config(organization_id)
 
+    cached = _provider_cache.get(organization_id)
+    if cached and cached[0] > time.monotonic() and cached[1] == config:
+        return cached[2]
+
     provider_type = config.get("provider", "twilio")
     logger.info(f"Creating {provider_type} telephony provider")
 
     # Create provider instance with configuration
-    if provider_type == "twilio":
-        return TwilioProvider(config)
-
-    elif provider_type == "vonage":
-        return VonageProvider(config)
-
-    elif provider_type == "vobiz":
-        return VobizProvider(config)
-
-    elif provider_type == "cloudonix":
-        return CloudonixProvider(config)
-
-    elif provider_type == "livekit":
-        return LiveKitProvider(config)
-
-    else:
+    provider_class = _PROVIDER_CLASSES.get(provider_type)
+    if provider_class is None:
         raise ValueError(f"Unknown telephony provider: {provider_type}")
 
+    provider = provider_class(config)
+    _provider_cache[organization_id] = (
+        time.monotonic() + TELEPHONY_CONFIG_CACHE_TTL_SECONDS,
+        config,
+        provider,
+    )
+    return provider
+
 
 async def get_all_telephony_providers() -> List[Type[TelephonyProvider]]:
     """
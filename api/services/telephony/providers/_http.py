@@ -0,0 +1,69 @@
+"""Shared HTTP session for telephony provider API calls.
+
+Providers make short REST calls (initiate call, status, cost) on every dial.
+Reusing one session keeps connections alive between calls instead of paying
+for DNS, TCP and TLS setup each time.
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use.
+
+    A new session is created if the previous one was closed or belongs to a
+    different event loop (e.g. a worker process restarting its loop).
+
+    The session is shared by every organization's provider, so it ignores
+    cookies rather than replaying one account's cookies on another's requests.
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            _close_stale_session(_session, _session_loop, loop)
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(
+                limit=300,
+                limit_per_host=75,
+                ttl_dns_cache=600,
+                keepalive_timeout=60,
+            ),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        _session_loop = loop
+    return _session
+
+
+def _close_stale_session(
+    session: aiohttp.ClientSession,
+    session_loop: Optional[asyncio.AbstractEventLoop],
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Close a session left behind by a previous event loop."""
+    if session_loop is not None and not session_loop.is_closed():
+        # The old loop can still run the close (e.g. it lives in another thread)
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        return
+
+    # The old loop is closed, so its connections are already dead and closing
+    # the connector has nothing to wait on; finish the close on this loop
+    loop.create_task(session.close())
+
+
+async def close_session() -> None:
+    """Close the shared session. Called on application shutdown."""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
@@ -4,9 +4,9 @@ Cloudonix implementation of the TelephonyProvider interface.
 
 import json
 import random
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
-import aiohttp
 from loguru import logger
 
 from api.enums import WorkflowRunMode
@@ -14,12 +14,34 @@ from api.services.telephony.base import (
     CallInitiationResult,
     NormalizedInboundData,
     TelephonyProvider,
+    first_truthy,
 )
+from api.services.telephony.providers._http import get_session
 from api.utils.tunnel import TunnelURLProvider
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
+# Field names Cloudonix uses for the same value across its payloads
+_DNID_NUMBER_KEYS = ("source", "dnid")
+_STATUS_CALL_ID_KEYS = ("token", "session_id", "CallSid")
+_STATUS_FROM_KEYS = ("caller_id", "From")
+_STATUS_TO_KEYS = ("destination", "To")
+_STATUS_DURATION_KEYS = ("duration", "CallDuration")
+_INBOUND_CALL_ID_KEYS = ("Session", "CallSid")
+_INBOUND_ACCOUNT_KEYS = ("Domain", "AccountSid")
+
+# Headers only Cloudonix sends on its webhooks
+_CLOUDONIX_WEBHOOK_HEADERS = (
+    "x-cx-apikey",
+    "x-cx-domain",
+    "x-cx-session",
+    "x-cx-source",
+)
+
+# Deletes the formatting characters allowed in phone numbers in a single pass
+_PHONE_FORMATTING_TABLE = str.maketrans("", "", " -()")
+
 
 class CloudonixProvider(TelephonyProvider):
     """
@@ -50,12 +72,16 @@ class CloudonixProvider(TelephonyProvider):
 
         self.base_url = "https://api.cloudonix.io"
 
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Generate authorization headers for Cloudonix API."""
-        return {
-            "Authorization": f"Bearer {self.bearer_token}",
-            "Content-Type": "application/json",
-        }
+        self._auth_headers = MappingProxyType(
+            {
+                "Authorization": f"Bearer {self.bearer_token}",
+                "Content-Type": "application/json",
+            }
+        )
+
+    def _get_auth_headers(self) -> Mapping[str, str]:
+        """Return the (read-only) authorization headers for Cloudonix API."""
+        return self._auth_headers
 
     async def initiate_call(
         self,
@@ -115,11 +141,6 @@ class CloudonixProvider(TelephonyProvider):
         # Make the API request
         headers = self._get_auth_headers()
 
-        # Log request details (mask sensitive token)
-        masked_headers = {
-            k: v if k != "Authorization" else f"Bearer {self.bearer_token[:8]}..."
-            for k, v in headers.items()
-        }
         logger.info(
             f"[Cloudonix] Initiating outbound call:\n"
             f"  Endpoint: {endpoint}\n"
@@ -127,70 +148,77 @@ class CloudonixProvider(TelephonyProvider):
             f"  From: {from_number}\n"
             f"  Workflow Run ID: {workflow_run_id}"
         )
-        logger.debug(
-            f"[Cloudonix] Request details:\n"
-            f"  Headers: {masked_headers}\n"
-            f"  Payload: {json.dumps(data, indent=2)}"
+        # Log request details (mask sensitive token). Only built when debug
+        # logging is enabled, since the payload dump runs on every call.
+        logger.opt(lazy=True).debug(
+            "[Cloudonix] Request details:\n  Headers: {}\n  Payload: {}",
+            lambda: {
+                k: v if k != "Authorization" else f"Bearer {self.bearer_token[:8]}..."
+                for k, v in headers.items()
+            },
+            lambda: json.dumps(data, indent=2),
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=data, headers=headers) as response:
-                response_text = await response.text()
-                response_status = response.status
+        session = get_session()
+        async with session.post(endpoint, json=data, headers=headers) as response:
+            response_status = response.status
 
-                # Log response
-                logger.info(
-                    f"[Cloudonix] API Response:\n"
+            if response_status != 200:
+                # Only read the body as text on failure; success bodies are
+                # decoded once as JSON below
+                response_text = await response.text()
+                logger.error(
+                    f"[Cloudonix] Call initiation FAILED:\n"
                     f"  HTTP Status: {response_status}\n"
-                    f"  Response Body: {response_text}"
+                    f"  Error Details: {response_text}\n"
+                    f"  Request: POST {endpoint}\n"
+                    f"  Payload: {json.dumps(data, indent=2)}"
+                )
+                raise Exception(
+                    f"Failed to initiate call via Cloudonix (HTTP {response_status}): {response_text}"
                 )
 
-                if response_status != 200:
-                    logger.error(
-                        f"[Cloudonix] Call initiation FAILED:\n"
-                        f"  HTTP Status: {response_status}\n"
-                        f"  Error Details: {response_text}\n"
-                        f"  Request: POST {endpoint}\n"
-                        f"  Payload: {json.dumps(data, indent=2)}"
-                    )
-                    raise Exception(
-                        f"Failed to initiate call via Cloudonix (HTTP {response_status}): {response_text}"
-                    )
+            response_data = await response.json()
 
-                response_data = await response.json()
+            # Log response
+            logger.info(
+                f"[Cloudonix] API Response:\n"
+                f"  HTTP Status: {response_status}\n"
+                f"  Response Body: {response_data}"
+            )
 
-                # Extract session token (call ID) and other metadata
-                session_token = response_data.get("token")
-                domain_id = response_data.get("domainId")
-                subscriber_id = response_data.get("subscriberId")
+            # Extract session token (call ID) and other metadata
+            session_token = response_data.get("token")
+            domain_id = response_data.get("domainId")
+            subscriber_id = response_data.get("subscriberId")
 
-                if not session_token:
-                    logger.error(
-                        f"[Cloudonix] Missing session token in response:\n"
-                        f"  Response: {json.dumps(response_data, indent=2)}"
-                    )
-                    raise Exception("No session token returned from Cloudonix")
-
-                logger.info(
-                    f"[Cloudonix] Call initiated successfully:\n"
-                    f"  Session Token: {session_token}\n"
-                    f"  Domain ID: {domain_id}\n"
-                    f"  Subscriber ID: {subscriber_id}\n"
-                    f"  To: {to_number}\n"
-                    f"  From: {from_number}\n"
-                    f"  Workflow Run ID: {workflow_run_id}"
+            if not session_token:
+                logger.error(
+                    f"[Cloudonix] Missing session token in response:\n"
+                    f"  Response: {json.dumps(response_data, indent=2)}"
                 )
+                raise Exception("No session token returned from Cloudonix")
+
+            logger.info(
+                f"[Cloudonix] Call initiated successfully:\n"
+                f"  Session Token: {session_token}\n"
+                f"  Domain ID: {domain_id}\n"
+                f"  Subscriber ID: {subscriber_id}\n"
+                f"  To: {to_number}\n"
+                f"  From: {from_number}\n"
+                f"  Workflow Run ID: {workflow_run_id}"
+            )
 
-                return CallInitiationResult(
-                    call_id=session_token,
-                    status="initiated",
-                    provider_metadata={
-                        "session_token": session_token,
-                        "domain_id": domain_id,
-                        "subscriber_id": subscriber_id,
-                    },
-                    raw_response=response_data,
-                )
+            return CallInitiationResult(
+                call_id=session_token,
+                status="initiated",
+                provider_metadata={
+                    "session_token": session_token,
+                    "domain_id": domain_id,
+                    "subscriber_id": subscriber_id,
+                },
+                raw_response=response_data,
+            )
 
     async def get_call_status(self, call_id: str) -> Dict[str, Any]:
         """
@@ -208,14 +236,14 @@ class CloudonixProvider(TelephonyProvider):
         )
 
         headers = self._get_auth_headers()
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status != 200:
-                    error_data = await response.text()
-                    logger.error(f"Failed to get call status: {error_data}")
-                    raise Exception(f"Failed to get call status: {error_data}")
+        session = get_session()
+        async with session.get(endpoint, headers=headers) as response:
+            if response.status != 200:
+                error_data = await response.text()
+                logger.error(f"Failed to get call status: {error_data}")
+                raise Exception(f"Failed to get call status: {error_data}")
 
-                return await response.json()
+            return await response.json()
 
     async def get_available_phone_numbers(self) -> List[str]:
         """
@@ -233,27 +261,27 @@ class CloudonixProvider(TelephonyProvider):
 
         headers = self._get_auth_headers()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(endpoint, headers=headers) as response:
-                    if response.status != 200:
-                        logger.warning(
-                            f"Failed to fetch DNIDs from Cloudonix: {response.status}"
-                        )
-                        return []
-
-                    dnids = await response.json()
-
-                    # Extract phone numbers from DNID objects
-                    # Use "source" field which contains the original phone number
-                    phone_numbers = [
-                        dnid.get("source") or dnid.get("dnid")
-                        for dnid in dnids
-                        if dnid.get("source") or dnid.get("dnid")
-                    ]
-
-                    # Cache the fetched numbers
-                    self.from_numbers = phone_numbers
-                    return phone_numbers
+            session = get_session()
+            async with session.get(endpoint, headers=headers) as response:
+                if response.status != 200:
+                    logger.warning(
+                        f"Failed to fetch DNIDs from Cloudonix: {response.status}"
+                    )
+                    return []
+
+                dnids = await response.json()
+
+                # Extract phone numbers from DNID objects
+                # Use "source" field which contains the original phone number
+                phone_numbers = [
+                    number
+                    for dnid in dnids
+                    if (number := first_truthy(dnid, _DNID_NUMBER_KEYS))
+                ]
+
+                # Cache the fetched numbers
+                self.from_numbers = phone_numbers
+                return phone_numbers
 
         except Exception as e:
             logger.error(f"Exception fetching Cloudonix DNIDs: {e}")
@@ -331,14 +359,12 @@ class CloudonixProvider(TelephonyProvider):
         mapped_status = status_map.get(call_status.lower(), call_status)
 
         return {
-            "call_id": data.get("token")
-            or data.get("session_id")
-            or data.get("CallSid", ""),
+            "call_id": first_truthy(data, _STATUS_CALL_ID_KEYS, ""),
             "status": mapped_status,
-            "from_number": data.get("caller_id") or data.get("From"),
-            "to_number": data.get("destination") or data.get("To"),
+            "from_number": first_truthy(data, _STATUS_FROM_KEYS),
+            "to_number": first_truthy(data, _STATUS_TO_KEYS),
             "direction": data.get("direction"),
-            "duration": data.get("duration") or data.get("CallDuration"),
+            "duration": first_truthy(data, _STATUS_DURATION_KEYS),
             "extra": data,  # Include all original data
         }
 
@@ -436,13 +462,7 @@ class CloudonixProvider(TelephonyProvider):
             return True
 
         # 2: Check for Cloudonix-specific headers
-        cloudonix_headers = [
-            "x-cx-apikey",
-            "x-cx-domain",
-            "x-cx-session",
-            "x-cx-source",
-        ]
-        if any(header in headers for header in cloudonix_headers):
+        if any(header in headers for header in _CLOUDONIX_WEBHOOK_HEADERS):
             return True
 
         # 3: Check data structure for Cloudonix-specific fields
@@ -476,9 +496,9 @@ class CloudonixProvider(TelephonyProvider):
         session_data = webhook_data.get("SessionData", {})
         token = session_data.get("token", "") if isinstance(session_data, dict) else ""
 
-        call_id = webhook_data.get("Session") or webhook_data.get("CallSid") or token
+        call_id = first_truthy(webhook_data, _INBOUND_CALL_ID_KEYS, token)
 
-        account_id = webhook_data.get("Domain") or webhook_data.get("AccountSid", "")
+        account_id = first_truthy(webhook_data, _INBOUND_ACCOUNT_KEYS, "")
 
         # Extract underlying provider information from SessionData if available
         session_data = webhook_data.get("SessionData", {})
@@ -535,12 +555,7 @@ class CloudonixProvider(TelephonyProvider):
             return ""
 
         # Remove any spaces or formatting
-        clean_number = (
-            phone_number.replace(" ", "")
-            .replace("-", "")
-            .replace("(", "")
-            .replace(")", "")
-        )
+        clean_number = phone_number.translate(_PHONE_FORMATTING_TABLE)
 
         # If already in E.164 format (+...), return as-is
         if clean_number.startswith("+"):
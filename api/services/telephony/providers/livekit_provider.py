@@ -1,23 +1,92 @@
+import json
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from api.enums import WorkflowRunMode
 from api.services.livekit_service import LiveKitTokenService
 from api.services.telephony.base import CallInitiationResult, TelephonyProvider
-from livekit import api as livekit_api
-from livekit.protocol.sip import CreateSIPParticipantRequest
+from api.services.telephony.providers._http import get_session
+
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+    from livekit import api as livekit_api
+
+# SIP 拨号前缀改写规则：(号码前缀, 替换为)，仅匹配号码开头
+_DIAL_PREFIX_REWRITES = (("+62", "885562"),)
+
+
+_ROOM_PREFIX = "dograh-room-"
+
+
+def _apply_dial_plan(number: str) -> str:
+    for prefix, replacement in _DIAL_PREFIX_REWRITES:
+        if number.startswith(prefix):
+            return replacement + number[len(prefix) :]
+    return number
+
 
 class LiveKitProvider(TelephonyProvider):
     PROVIDER_NAME = WorkflowRunMode.LIVEKIT.value
     WEBHOOK_ENDPOINT = None
 
+    # 每个组织缓存一个实例，使用 __slots__ 省去实例 __dict__
+    __slots__ = (
+        "_config",
+        "_url",
+        "_is_valid",
+        "_lkapi",
+        "_lkapi_session",
+        "_service",
+    )
+
     def __init__(self, config: Dict[str, Any]) -> None:
         self._config = config
+        # URL 来自配置且不变，缓存字符串以免每次调用都经过 service.url 属性
+        self._url = config.get("url", "")
+        # 配置在实例创建后不再变化，校验结果只计算一次
+        self._is_valid = bool(
+            config.get("api_key")
+            and config.get("api_secret")
+            and config.get("url")
+            and config.get("sip_trunk_id")
+        )
+        # LiveKit API 客户端按实例复用，底层使用共享的 aiohttp 会话
+        self._lkapi: Optional["livekit_api.LiveKitAPI"] = None
+        self._lkapi_session = None
+        # 凭据在实例生命周期内不变，token 服务按需创建一次
+        self._service: Optional[LiveKitTokenService] = None
+
+    def _get_service(self) -> LiveKitTokenService:
+        if self._service is None:
+            self._service = LiveKitTokenService.from_values(
+                api_key=self._config.get("api_key", ""),
+                api_secret=self._config.get("api_secret", ""),
+                url=self._url,
+            )
+        return self._service
 
     @staticmethod
     def _get_api_url(url: str) -> str:
         return url
 
+    def _get_api(
+        self, url: str, api_key: str, api_secret: str
+    ) -> "livekit_api.LiveKitAPI":
+        # 共享会话被重建（如事件循环变化）时同步重建客户端
+        session = get_session()
+        if self._lkapi is None or self._lkapi_session is not session:
+            # LiveKit SDK 导入开销较大，仅在首次创建客户端时加载
+            from livekit import api as livekit_api
+
+            self._lkapi = livekit_api.LiveKitAPI(
+                url=url,
+                api_key=api_key,
+                api_secret=api_secret,
+                session=session,
+            )
+            self._lkapi_session = session
+        return self._lkapi
+
     async def initiate_call(
         self,
         to_number: str,
@@ -25,27 +94,28 @@ class LiveKitProvider(TelephonyProvider):
         workflow_run_id: Optional[int] = None,
         **kwargs: Any,
     ) -> CallInitiationResult:
+        # 房间名与 agent/caller 身份共用同一后缀，无 workflow_run_id 时只生成一次 UUID
+        suffix = workflow_run_id or uuid.uuid4().hex
+
         # 生成/复用 LiveKit 房间名
-        room_name = kwargs.get("room_name")
-        if not room_name:
-            suffix = workflow_run_id or uuid.uuid4()
-            room_name = f"dograh-room-{suffix}"
+        get = kwargs.get
+        room_name = get("room_name") or _ROOM_PREFIX + str(suffix)
 
         # 使用组织级 LiveKit 配置生成 agent token
-        service = LiveKitTokenService.from_values(
-            api_key=self._config.get("api_key", ""),
-            api_secret=self._config.get("api_secret", ""),
-            url=self._config.get("url", ""),
-        )
+        service = self._get_service()
 
         # agent 与 caller 使用不同身份与显示名，避免同名参与者
-        agent_identity = kwargs.get("identity") or f"agent-{workflow_run_id or uuid.uuid4()}"
-        agent_name = kwargs.get("participant_name") or "Agent"
+        agent_identity = get("identity") or f"agent-{suffix}"
+        agent_name = get("participant_name") or "Agent"
+        # LiveKit 的 metadata 声明必须是字符串，dict 在此一次性紧凑序列化
+        metadata = get("metadata")
+        if isinstance(metadata, dict):
+            metadata = json.dumps(metadata, separators=(",", ":"))
         token, identity = service.create_participant_token(
             room_name=room_name,
             identity=agent_identity,
             participant_name=agent_name,
-            metadata=kwargs.get("metadata"),
+            metadata=metadata,
         )
 
         # SIP 呼出依赖 LiveKit SIP Trunk
@@ -56,15 +126,16 @@ class LiveKitProvider(TelephonyProvider):
             raise ValueError("livekit_sip_trunk_id_required")
 
         # 呼叫方的独立身份与显示名
-        caller_identity = f"caller-{workflow_run_id or uuid.uuid4()}"
-        caller_name = kwargs.get("caller_name") or "Caller"
-        participant_metadata = kwargs.get("participant_metadata")
+        caller_identity = f"caller-{suffix}"
+        caller_name = get("caller_name") or "Caller"
+        participant_metadata = get("participant_metadata")
 
+        from livekit.protocol.sip import CreateSIPParticipantRequest
 
         # 创建 SIP 参与者并等待接听完成后再继续
         sip_request = CreateSIPParticipantRequest(
             sip_trunk_id=sip_trunk_id,
-            sip_call_to=to_number.replace("+62","885562"),
+            sip_call_to=_apply_dial_plan(to_number),
             room_name=room_name,
             participant_identity=caller_identity,
             participant_name=caller_name,
@@ -75,20 +146,16 @@ class LiveKitProvider(TelephonyProvider):
             sip_request.sip_call_to = sip_call_to
 
         # LiveKit API 需要 HTTP(S) URL（从 ws/wss 转换）
-        api_url = self._get_api_url(service.url)
-        async with livekit_api.LiveKitAPI(
-            url=api_url,
-            api_key=service.api_key,
-            api_secret=service.api_secret,
-        ) as lkapi:
-            sip_participant = await lkapi.sip.create_sip_participant(sip_request)
+        api_url = self._get_api_url(self._url)
+        lkapi = self._get_api(api_url, service.api_key, service.api_secret)
+        sip_participant = await lkapi.sip.create_sip_participant(sip_request)
 
         # 返回用于前端/日志的 LiveKit 会话信息
         provider_metadata = {
             "room_name": room_name,
             "identity": identity,
             "token": token,
-            "url": service.url,
+            "url": self._url,
             "sip_trunk_id": sip_trunk_id,
             "sip_call_to": sip_call_to,
             "sip_participant_id": sip_participant.participant_id,
@@ -100,7 +167,6 @@ class LiveKitProvider(TelephonyProvider):
             call_id=room_name,
             status="ready",
             provider_metadata=provider_metadata,
-            raw_response=provider_metadata,
         )
 
     async def get_call_status(self, call_id: str) -> Dict[str, Any]:
@@ -110,12 +176,7 @@ class LiveKitProvider(TelephonyProvider):
         return []
 
     def validate_config(self) -> bool:
-        return bool(
-            self._config.get("api_key")
-            and self._config.get("api_secret")
-            and self._config.get("url")
-            and self._config.get("sip_trunk_id")
-        )
+        return self._is_valid
 
     async def verify_webhook_signature(
         self, url: str, params: Dict[str, Any], signature: str
@@ -5,6 +5,7 @@ Twilio implementation of the TelephonyProvider interface.
 import json
 import random
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from xml.sax.saxutils import escape
 
 import aiohttp
 from loguru import logger
@@ -15,12 +16,40 @@ from api.services.telephony.base import (
     CallInitiationResult,
     NormalizedInboundData,
     TelephonyProvider,
+    first_truthy,
 )
+from api.services.telephony.providers._http import get_session
 from api.utils.tunnel import TunnelURLProvider
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
+# TwiML documents rendered for every call; only the placeholders vary
+_TWIML_CONNECT_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Connect>
+        <Stream url="{url}"{status_callback}></Stream>
+    </Connect>
+    <Pause length="40"/>
+</Response>"""
+
+_TWIML_SAY_HANGUP_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="alice">{message}</Say>
+    <Hangup/>
+</Response>"""
+
+# Headers only Twilio sends on its webhooks
+_TWILIO_WEBHOOK_HEADERS = (
+    "x-twilio-signature",
+    "i-twilio-idempotency-token",
+    "x-home-region",
+)
+
+_DURATION_KEYS = ("CallDuration", "Duration")
+_FROM_COUNTRY_KEYS = ("FromCountry", "CallerCountry")
+_TO_COUNTRY_KEYS = ("ToCountry", "CalledCountry")
+
 
 class TwilioProvider(TelephonyProvider):
     """
@@ -48,9 +77,13 @@ class TwilioProvider(TelephonyProvider):
         # Handle both single number (string) and multiple numbers (list)
         if isinstance(self.from_numbers, str):
             self.from_numbers = [self.from_numbers]
+        self._n_from = len(self.from_numbers)
 
         self.base_url = f"https://api.twilio.com/2010-04-01/Accounts/{self.account_sid}"
 
+        # Created on first webhook verification and reused afterwards
+        self._validator: Optional[RequestValidator] = None
+
     async def initiate_call(
         self,
         to_number: str,
@@ -67,7 +100,7 @@ class TwilioProvider(TelephonyProvider):
         endpoint = f"{self.base_url}/Calls.json"
 
         # Select a random phone number
-        from_number = random.choice(self.from_numbers)
+        from_number = self.from_numbers[random.randrange(self._n_from)]
         logger.info(f"Selected phone number {from_number} for outbound call")
 
         # Prepare call data
@@ -93,21 +126,21 @@ class TwilioProvider(TelephonyProvider):
         data.update(kwargs)
 
         # Make the API request
-        async with aiohttp.ClientSession() as session:
-            auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
-            async with session.post(endpoint, data=data, auth=auth) as response:
-                if response.status != 201:
-                    error_data = await response.json()
-                    raise Exception(f"Failed to initiate call: {error_data}")
-
-                response_data = await response.json()
-
-                return CallInitiationResult(
-                    call_id=response_data["sid"],
-                    status=response_data.get("status", "queued"),
-                    provider_metadata={},  # Twilio doesn't need to persist extra data
-                    raw_response=response_data,
-                )
+        session = get_session()
+        auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
+        async with session.post(endpoint, data=data, auth=auth) as response:
+            if response.status != 201:
+                error_data = await response.json()
+                raise Exception(f"Failed to initiate call: {error_data}")
+
+            response_data = await response.json()
+
+            return CallInitiationResult(
+                call_id=response_data["sid"],
+                status=response_data.get("status", "queued"),
+                provider_metadata={},  # Twilio doesn't need to persist extra data
+                raw_response=response_data,
+            )
 
     async def get_call_status(self, call_id: str) -> Dict[str, Any]:
         """
@@ -118,14 +151,14 @@ class TwilioProvider(TelephonyProvider):
 
         endpoint = f"{self.base_url}/Calls/{call_id}.json"
 
-        async with aiohttp.ClientSession() as session:
-            auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
-            async with session.get(endpoint, auth=auth) as response:
-                if response.status != 200:
-                    error_data = await response.json()
-                    raise Exception(f"Failed to get call status: {error_data}")
+        session = get_session()
+        auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
+        async with session.get(endpoint, auth=auth) as response:
+            if response.status != 200:
+                error_data = await response.json()
+                raise Exception(f"Failed to get call status: {error_data}")
 
-                return await response.json()
+            return await response.json()
 
     async def get_available_phone_numbers(self) -> List[str]:
         """
@@ -149,8 +182,9 @@ class TwilioProvider(TelephonyProvider):
             logger.error("No auth token available for webhook signature verification")
             return False
 
-        validator = RequestValidator(self.auth_token)
-        return validator.validate(url, params, signature)
+        if self._validator is None:
+            self._validator = RequestValidator(self.auth_token)
+        return self._validator.validate(url, params, signature)
 
     async def get_webhook_response(
         self, workflow_id: int, user_id: int, workflow_run_id: int
@@ -160,14 +194,10 @@ class TwilioProvider(TelephonyProvider):
         """
         backend_endpoint = await TunnelURLProvider.get_tunnel_url()
 
-        twiml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Connect>
-        <Stream url="wss://{backend_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}"></Stream>
-    </Connect>
-    <Pause length="40"/>
-</Response>"""
-        return twiml_content
+        return _TWIML_CONNECT_TEMPLATE.format(
+            url=f"wss://{backend_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}",
+            status_callback="",
+        )
 
     async def get_call_cost(self, call_id: str) -> Dict[str, Any]:
         """
@@ -182,36 +212,36 @@ class TwilioProvider(TelephonyProvider):
         endpoint = f"{self.base_url}/Calls/{call_id}.json"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
-                async with session.get(endpoint, auth=auth) as response:
-                    if response.status != 200:
-                        error_data = await response.json()
-                        logger.error(f"Failed to get Twilio call cost: {error_data}")
-                        return {
-                            "cost_usd": 0.0,
-                            "duration": 0,
-                            "status": "error",
-                            "error": str(error_data),
-                        }
-
-                    call_data = await response.json()
-
-                    # Twilio returns price as a negative string (e.g., "-0.0085")
-                    price_str = call_data.get("price", "0")
-                    cost_usd = abs(float(price_str)) if price_str else 0.0
-
-                    # Duration is in seconds as a string
-                    duration = int(call_data.get("duration", "0"))
-
+            session = get_session()
+            auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
+            async with session.get(endpoint, auth=auth) as response:
+                if response.status != 200:
+                    error_data = await response.json()
+                    logger.error(f"Failed to get Twilio call cost: {error_data}")
                     return {
-                        "cost_usd": cost_usd,
-                        "duration": duration,
-                        "status": call_data.get("status", "unknown"),
-                        "price_unit": call_data.get("price_unit", "USD"),
-                        "raw_response": call_data,
+                        "cost_usd": 0.0,
+                        "duration": 0,
+                        "status": "error",
+                        "error": str(error_data),
                     }
 
+                call_data = await response.json()
+
+                # Twilio returns price as a negative string (e.g., "-0.0085")
+                price_str = call_data.get("price", "0")
+                cost_usd = abs(float(price_str)) if price_str else 0.0
+
+                # Duration is in seconds as a string
+                duration = int(call_data.get("duration", "0"))
+
+                return {
+                    "cost_usd": cost_usd,
+                    "duration": duration,
+                    "status": call_data.get("status", "unknown"),
+                    "price_unit": call_data.get("price_unit", "USD"),
+                    "raw_response": call_data,
+                }
+
         except Exception as e:
             logger.error(f"Exception fetching Twilio call cost: {e}")
             return {"cost_usd": 0.0, "duration": 0, "status": "error", "error": str(e)}
@@ -226,7 +256,7 @@ class TwilioProvider(TelephonyProvider):
             "from_number": data.get("From"),
             "to_number": data.get("To"),
             "direction": data.get("Direction"),
-            "duration": data.get("CallDuration") or data.get("Duration"),
+            "duration": first_truthy(data, _DURATION_KEYS),
             "extra": data,  # Include all original data
         }
 
@@ -305,17 +335,11 @@ class TwilioProvider(TelephonyProvider):
         - AccountSid format: starts with "AC" (not a domain)
         """
         # 1: Check for Twilio-specific User-Agent
-        user_agent = headers.get("user-agent", "")
-        if "twilioproxy" in user_agent.lower() or user_agent.startswith("TwilioProxy"):
+        if "twilioproxy" in headers.get("user-agent", "").lower():
             return True
 
         # 2: Check for Twilio-specific headers
-        twilio_headers = [
-            "x-twilio-signature",
-            "i-twilio-idempotency-token",
-            "x-home-region",
-        ]
-        if any(header in headers for header in twilio_headers):
+        if any(header in headers for header in _TWILIO_WEBHOOK_HEADERS):
             return True
 
         # 3: Check data structure - CallSid + AccountSid with AC prefix + ApiVersion
@@ -346,10 +370,8 @@ class TwilioProvider(TelephonyProvider):
             direction=webhook_data.get("Direction", ""),
             call_status=webhook_data.get("CallStatus", ""),
             account_id=webhook_data.get("AccountSid"),
-            from_country=webhook_data.get("FromCountry")
-            or webhook_data.get("CallerCountry"),
-            to_country=webhook_data.get("ToCountry")
-            or webhook_data.get("CalledCountry"),
+            from_country=first_truthy(webhook_data, _FROM_COUNTRY_KEYS),
+            to_country=first_truthy(webhook_data, _TO_COUNTRY_KEYS),
             raw_data=webhook_data,
         )
 
@@ -409,13 +431,9 @@ class TwilioProvider(TelephonyProvider):
             status_callback_url = f"https://{backend_endpoint}/api/v1/telephony/twilio/status-callback/{workflow_run_id}"
             status_callback_attr = f' statusCallback="{status_callback_url}"'
 
-        twiml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Connect>
-        <Stream url="{websocket_url}"{status_callback_attr}></Stream>
-    </Connect>
-    <Pause length="40"/>
-</Response>"""
+        twiml_content = _TWIML_CONNECT_TEMPLATE.format(
+            url=websocket_url, status_callback=status_callback_attr
+        )
 
         return Response(content=twiml_content, media_type="application/xml")
 
@@ -426,11 +444,9 @@ class TwilioProvider(TelephonyProvider):
         """
         from fastapi import Response
 
-        twiml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="alice">Sorry, there was an error processing your call. {message}</Say>
-    <Hangup/>
-</Response>"""
+        twiml_content = _TWIML_SAY_HANGUP_TEMPLATE.format(
+            message="Sorry, there was an error processing your call. " + escape(message)
+        )
 
         return Response(content=twiml_content, media_type="application/xml")
 
@@ -447,10 +463,6 @@ class TwilioProvider(TelephonyProvider):
             error_type, TELEPHONY_ERROR_MESSAGES[TelephonyError.GENERAL_AUTH_FAILED]
         )
 
-        twiml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="alice">{message}</Say>
-    <Hangup/>
-</Response>"""
+        twiml_content = _TWIML_SAY_HANGUP_TEMPLATE.format(message=escape(message))
 
         return Response(content=twiml_content, media_type="application/xml")
@@ -2,11 +2,14 @@
 Vobiz implementation of the TelephonyProvider interface.
 """
 
+import hashlib
+import hmac
 import json
 import random
+from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import aiohttp
 from loguru import logger
 
 from api.enums import WorkflowRunMode
@@ -14,12 +17,17 @@ from api.services.telephony.base import (
     CallInitiationResult,
     NormalizedInboundData,
     TelephonyProvider,
+    first_truthy,
 )
+from api.services.telephony.providers._http import get_session
 from api.utils.tunnel import TunnelURLProvider
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
+# Vobiz returns the call identifier under different names depending on the API
+_CALL_ID_KEYS = ("call_uuid", "CallUUID", "request_uuid", "RequestUUID")
+
 
 class VobizProvider(TelephonyProvider):
     """
@@ -47,9 +55,23 @@ class VobizProvider(TelephonyProvider):
         # Handle both single number (string) and multiple numbers (list)
         if isinstance(self.from_numbers, str):
             self.from_numbers = [self.from_numbers]
+        self._n_from = len(self.from_numbers)
 
         self.base_url = "https://api.vobiz.ai/api"
 
+        # HMAC key for webhook signature verification, encoded once
+        self._auth_token_bytes = (
+            self.auth_token.encode("utf-8") if self.auth_token else None
+        )
+
+        # Request headers never change for a provider instance
+        self._auth_headers = MappingProxyType(
+            {"X-Auth-ID": self.auth_id, "X-Auth-Token": self.auth_token}
+        )
+        self._json_headers = MappingProxyType(
+            {**self._auth_headers, "Content-Type": "application/json"}
+        )
+
     async def initiate_call(
         self,
         to_number: str,
@@ -72,7 +94,7 @@ class VobizProvider(TelephonyProvider):
         endpoint = f"{self.base_url}/v1/Account/{self.auth_id}/Call/"
 
         # Select a random phone number
-        from_number = random.choice(self.from_numbers)
+        from_number = self.from_numbers[random.randrange(self._n_from)]
         logger.info(f"Selected Vobiz phone number {from_number} for outbound call")
 
         # Remove + prefix if present (Vobiz expects E.164 without +)
@@ -105,46 +127,37 @@ class VobizProvider(TelephonyProvider):
         data.update(kwargs)
 
         # Make the API request
-        headers = {
-            "X-Auth-ID": self.auth_id,
-            "X-Auth-Token": self.auth_token,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=data, headers=headers) as response:
-                if response.status != 201:
-                    error_data = await response.text()
-                    logger.error(f"Vobiz API error: {error_data}")
-                    raise Exception(f"Failed to initiate Vobiz call: {error_data}")
-
-                response_data = await response.json()
-                logger.info(f"Vobiz API response: {response_data}")
-
-                # Extract call_uuid with multiple fallback options
-                call_id = (
-                    response_data.get("call_uuid")
-                    or response_data.get("CallUUID")
-                    or response_data.get("request_uuid")
-                    or response_data.get("RequestUUID")
-                )
+        session = get_session()
+        async with session.post(endpoint, json=data, headers=headers) as response:
+            if response.status != 201:
+                error_data = await response.text()
+                logger.error(f"Vobiz API error: {error_data}")
+                raise Exception(f"Failed to initiate Vobiz call: {error_data}")
+
+            response_data = await response.json()
+            logger.info(f"Vobiz API response: {response_data}")
+
+            # Extract call_uuid with multiple fallback options
+            call_id = first_truthy(response_data, _CALL_ID_KEYS)
 
-                if not call_id:
-                    logger.error(
-                        f"No call ID found in Vobiz response. Available keys: {list(response_data.keys())}"
-                    )
-                    raise Exception(
-                        f"Vobiz API response missing call identifier. Response: {response_data}"
-                    )
-
-                logger.info(f"Vobiz call initiated successfully. Call ID: {call_id}")
-
-                return CallInitiationResult(
-                    call_id=call_id,
-                    status="queued",  # Vobiz returns "message": "call fired"
-                    provider_metadata={},
-                    raw_response=response_data,
+            if not call_id:
+                logger.error(
+                    f"No call ID found in Vobiz response. Available keys: {list(response_data.keys())}"
                 )
+                raise Exception(
+                    f"Vobiz API response missing call identifier. Response: {response_data}"
+                )
+
+            logger.info(f"Vobiz call initiated successfully. Call ID: {call_id}")
+
+            return CallInitiationResult(
+                call_id=call_id,
+                status="queued",  # Vobiz returns "message": "call fired"
+                provider_metadata={},
+                raw_response=response_data,
+            )
 
     async def get_call_status(self, call_id: str) -> Dict[str, Any]:
         """
@@ -159,16 +172,16 @@ class VobizProvider(TelephonyProvider):
 
         endpoint = f"{self.base_url}/v1/Account/{self.auth_id}/Call/{call_id}/"
 
-        headers = {"X-Auth-ID": self.auth_id, "X-Auth-Token": self.auth_token}
+        headers = self._auth_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status != 200:
-                    error_data = await response.text()
-                    logger.error(f"Failed to get Vobiz call status: {error_data}")
-                    raise Exception(f"Failed to get call status: {error_data}")
+        session = get_session()
+        async with session.get(endpoint, headers=headers) as response:
+            if response.status != 200:
+                error_data = await response.text()
+                logger.error(f"Failed to get Vobiz call status: {error_data}")
+                raise Exception(f"Failed to get call status: {error_data}")
 
-                return await response.json()
+            return await response.json()
 
     async def get_available_phone_numbers(self) -> List[str]:
         """
@@ -198,15 +211,11 @@ class VobizProvider(TelephonyProvider):
         - Header: x-vobiz-timestamp (timestamp for replay protection)
         - Signature = HMAC-SHA256(auth_token, timestamp + '.' + body)
         """
-        import hashlib
-        import hmac
-        from datetime import datetime, timezone
-
         if not signature or not timestamp:
             logger.warning("Missing signature or timestamp headers for Vobiz webhook")
             return False
 
-        if not self.auth_token:
+        if not self._auth_token_bytes:
             logger.error(
                 "No auth_token available for Vobiz webhook signature verification"
             )
@@ -223,18 +232,26 @@ class VobizProvider(TelephonyProvider):
                 return False
 
             # 2. Signature verification
-            # Create expected signature: HMAC-SHA256(auth_token, timestamp + '.' + body)
-            payload = f"{timestamp}.{body}"
-            expected_signature = hmac.new(
-                self.auth_token.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256
-            ).hexdigest()
+            # Expected signature: HMAC-SHA256(auth_token, timestamp + '.' + body).
+            # Feed the parts separately so the signed payload is never copied.
+            mac = hmac.new(self._auth_token_bytes, None, hashlib.sha256)
+            mac.update(timestamp.encode("utf-8"))
+            mac.update(b".")
+            mac.update(body.encode("utf-8"))
+            expected_signature = mac.digest()
+
+            # 3. Compare raw digests (timing-safe comparison)
+            try:
+                received_signature = bytes.fromhex(signature)
+            except ValueError:
+                logger.warning("Vobiz webhook signature is not valid hex")
+                return False
 
-            # 3. Compare signatures (timing-safe comparison)
-            is_valid = hmac.compare_digest(expected_signature, signature)
+            is_valid = hmac.compare_digest(expected_signature, received_signature)
 
             if not is_valid:
                 logger.warning(
-                    f"Vobiz webhook signature mismatch. Expected: {expected_signature[:8]}..., Got: {signature[:8]}..."
+                    f"Vobiz webhook signature mismatch. Expected: {expected_signature.hex()[:8]}..., Got: {signature[:8]}..."
                 )
 
             return is_valid
@@ -280,37 +297,37 @@ class VobizProvider(TelephonyProvider):
         endpoint = f"{self.base_url}/v1/Account/{self.auth_id}/Call/{call_id}/"
 
         try:
-            headers = {"X-Auth-ID": self.auth_id, "X-Auth-Token": self.auth_token}
+            headers = self._auth_headers
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(endpoint, headers=headers) as response:
-                    if response.status != 200:
-                        error_data = await response.text()
-                        logger.error(f"Failed to get Vobiz call cost: {error_data}")
-                        return {
-                            "cost_usd": 0.0,
-                            "duration": 0,
-                            "status": "error",
-                            "error": str(error_data),
-                        }
+            session = get_session()
+            async with session.get(endpoint, headers=headers) as response:
+                if response.status != 200:
+                    error_data = await response.text()
+                    logger.error(f"Failed to get Vobiz call cost: {error_data}")
+                    return {
+                        "cost_usd": 0.0,
+                        "duration": 0,
+                        "status": "error",
+                        "error": str(error_data),
+                    }
 
-                    call_data = await response.json()
+                call_data = await response.json()
 
-                    # Vobiz returns cost as positive string (e.g., "0.04")
-                    total_cost_str = call_data.get("total_cost", "0")
-                    cost_usd = float(total_cost_str) if total_cost_str else 0.0
+                # Vobiz returns cost as positive string (e.g., "0.04")
+                total_cost_str = call_data.get("total_cost", "0")
+                cost_usd = float(total_cost_str) if total_cost_str else 0.0
 
-                    # Duration is billed_duration in seconds (integer)
-                    duration = int(call_data.get("billed_duration", 0))
+                # Duration is billed_duration in seconds (integer)
+                duration = int(call_data.get("billed_duration", 0))
 
-                    return {
-                        "cost_usd": cost_usd,
-                        "duration": duration,
-                        "status": call_data.get("status", "unknown"),
-                        "price_unit": "USD",  # Vobiz always uses USD
-                        "call_rate": call_data.get("call_rate", "0"),
-                        "raw_response": call_data,
-                    }
+                return {
+                    "cost_usd": cost_usd,
+                    "duration": duration,
+                    "status": call_data.get("status", "unknown"),
+                    "price_unit": "USD",  # Vobiz always uses USD
+                    "call_rate": call_data.get("call_rate", "0"),
+                    "raw_response": call_data,
+                }
 
         except Exception as e:
             logger.error(f"Exception fetching Vobiz call cost: {e}")
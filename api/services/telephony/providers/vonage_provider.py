@@ -5,11 +5,12 @@ Vonage (Nexmo) implementation of the TelephonyProvider interface.
 import json
 import random
 import time
+import uuid
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import aiohttp
 import jwt
 from fastapi import Response
+from jwt.algorithms import RSAAlgorithm
 from loguru import logger
 
 from api.enums import WorkflowRunMode
@@ -18,11 +19,14 @@ from api.services.telephony.base import (
     NormalizedInboundData,
     TelephonyProvider,
 )
+from api.services.telephony.providers._http import get_session
 from api.utils.tunnel import TunnelURLProvider
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
+JWT_TTL_SECONDS = 3600
+
 
 class VonageProvider(TelephonyProvider):
     """
@@ -55,23 +59,41 @@ class VonageProvider(TelephonyProvider):
         if isinstance(self.from_numbers, str):
             self.from_numbers = [self.from_numbers]
 
+        # Vonage expects numbers without the '+' prefix
+        self._dial_from_numbers = [n.replace("+", "") for n in self.from_numbers]
+        self._n_from = len(self._dial_from_numbers)
+
         self.base_url = "https://api.nexmo.com"
 
+        # Parsed RS256 signing key, loaded from the PEM on first use
+        self._signing_key = None
+
     def _generate_jwt(self) -> str:
-        """Generate JWT token for Vonage API authentication."""
+        """Generate JWT token for Vonage API authentication.
+
+        Every request gets a fresh token with its own jti. Parsing the PEM
+        private key is the costly part of signing, so the parsed key is kept
+        for the lifetime of the provider.
+        """
         if not self.application_id or not self.private_key:
             raise ValueError(
                 "Application ID and private key required for JWT generation"
             )
 
+        if self._signing_key is None:
+            self._signing_key = RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(
+                self.private_key
+            )
+
+        now = int(time.time())
         claims = {
             "application_id": self.application_id,
-            "iat": int(time.time()),
-            "exp": int(time.time()) + 3600,
-            "jti": str(time.time()),
+            "iat": now,
+            "exp": now + JWT_TTL_SECONDS,
+            "jti": str(uuid.uuid4()),
         }
 
-        return jwt.encode(claims, self.private_key, algorithm="RS256")
+        return jwt.encode(claims, self._signing_key, algorithm="RS256")
 
     async def initiate_call(
         self,
@@ -88,10 +110,9 @@ class VonageProvider(TelephonyProvider):
 
         endpoint = f"{self.base_url}/v1/calls"
 
-        # Select a random phone number
-        from_number = random.choice(self.from_numbers)
+        # Select a random phone number (already stripped of '+')
+        from_number = self._dial_from_numbers[random.randrange(self._n_from)]
         # Remove '+' prefix for Vonage
-        from_number = from_number.replace("+", "")
         to_number = to_number.replace("+", "")
 
         logger.info(f"Selected phone number {from_number} for outbound call")
@@ -120,23 +141,23 @@ class VonageProvider(TelephonyProvider):
         }
 
         # Make the API request
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=data, headers=headers) as response:
-                response_data = await response.json()
-
-                if response.status != 201:
-                    raise Exception(f"Failed to initiate call: {response_data}")
-
-                return CallInitiationResult(
-                    call_id=response_data["uuid"],
-                    status=response_data.get("status", "started"),
-                    provider_metadata={
-                        "call_uuid": response_data[
-                            "uuid"
-                        ]  # Vonage needs UUID persisted for WebSocket
-                    },
-                    raw_response=response_data,
-                )
+        session = get_session()
+        async with session.post(endpoint, json=data, headers=headers) as response:
+            response_data = await response.json()
+
+            if response.status != 201:
+                raise Exception(f"Failed to initiate call: {response_data}")
+
+            return CallInitiationResult(
+                call_id=response_data["uuid"],
+                status=response_data.get("status", "started"),
+                provider_metadata={
+                    "call_uuid": response_data[
+                        "uuid"
+                    ]  # Vonage needs UUID persisted for WebSocket
+                },
+                raw_response=response_data,
+            )
 
     async def get_call_status(self, call_id: str) -> Dict[str, Any]:
         """
@@ -151,13 +172,13 @@ class VonageProvider(TelephonyProvider):
         token = self._generate_jwt()
         headers = {"Authorization": f"Bearer {token}"}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status != 200:
-                    error_data = await response.json()
-                    raise Exception(f"Failed to get call status: {error_data}")
+        session = get_session()
+        async with session.get(endpoint, headers=headers) as response:
+            if response.status != 200:
+                error_data = await response.json()
+                raise Exception(f"Failed to get call status: {error_data}")
 
-                return await response.json()
+            return await response.json()
 
     async def get_available_phone_numbers(self) -> List[str]:
         """
@@ -235,44 +256,44 @@ class VonageProvider(TelephonyProvider):
         Returns:
             Dict containing cost information
         """
-        headers = self._get_auth_headers()
-        endpoint = f"https://api.nexmo.com/v1/calls/{call_id}"
+        endpoint = f"{self.base_url}/v1/calls/{call_id}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(endpoint, headers=headers) as response:
-                    if response.status != 200:
-                        error_data = await response.json()
-                        logger.error(f"Failed to get Vonage call cost: {error_data}")
-                        return {
-                            "cost_usd": 0.0,
-                            "duration": 0,
-                            "status": "error",
-                            "error": str(error_data),
-                        }
-
-                    call_data = await response.json()
-
-                    # Vonage returns price and rate
-                    # Price is the total cost, rate is the per-minute rate
-                    price = float(call_data.get("price", 0))
-                    cost_usd = price  # Vonage returns positive values
-
-                    # Duration is in seconds
-                    duration = int(call_data.get("duration", 0))
-
-                    # Get the call status
-                    status = call_data.get("status", "unknown")
-
+            headers = self._get_auth_headers()
+            session = get_session()
+            async with session.get(endpoint, headers=headers) as response:
+                if response.status != 200:
+                    error_data = await response.json()
+                    logger.error(f"Failed to get Vonage call cost: {error_data}")
                     return {
-                        "cost_usd": cost_usd,
-                        "duration": duration,
-                        "status": status,
-                        "price_unit": "USD",  # Vonage uses USD by default
-                        "rate": call_data.get("rate", 0),  # Per-minute rate
-                        "raw_response": call_data,
+                        "cost_usd": 0.0,
+                        "duration": 0,
+                        "status": "error",
+                        "error": str(error_data),
                     }
 
+                call_data = await response.json()
+
+                # Vonage returns price and rate
+                # Price is the total cost, rate is the per-minute rate
+                price = float(call_data.get("price", 0))
+                cost_usd = price  # Vonage returns positive values
+
+                # Duration is in seconds
+                duration = int(call_data.get("duration", 0))
+
+                # Get the call status
+                status = call_data.get("status", "unknown")
+
+                return {
+                    "cost_usd": cost_usd,
+                    "duration": duration,
+                    "status": status,
+                    "price_unit": "USD",  # Vonage uses USD by default
+                    "rate": call_data.get("rate", 0),  # Per-minute rate
+                    "raw_response": call_data,
+                }
+
         except Exception as e:
             logger.error(f"Exception fetching Vonage call cost: {e}")
             return {"cost_usd": 0.0, "duration": 0, "status": "error", "error": str(e)}
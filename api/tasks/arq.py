@@ -41,6 +41,7 @@ REDIS_SETTINGS = RedisSettings(
     ssl_check_hostname=False if use_ssl else None,
 )
 
+from api.services.telephony.providers._http import close_session
 from api.tasks.campaign_tasks import (
     monitor_campaign_progress,
     process_campaign_batch,
@@ -55,6 +56,10 @@ from api.tasks.s3_upload import (
 )
 
 
+async def shutdown(ctx):
+    await close_session()
+
+
 class WorkerSettings:
     functions = [
         calculate_workflow_run_cost,
@@ -70,6 +75,7 @@ class WorkerSettings:
     cron_jobs = []
     redis_settings = REDIS_SETTINGS
     max_jobs = 10
+    on_shutdown = shutdown
 
 
 LOG_CONFIG = {
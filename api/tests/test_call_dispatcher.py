@@ -0,0 +1,208 @@
+"""Tests for CampaignCallDispatcher.process_batch.
+
+These cover how a batch of queued runs is dispatched:
+1. Slots and rate-limit tokens are taken in queue order, calls run concurrently
+2. A rate-limit timeout skips the row without creating a workflow run
+3. processed_rows is written as each run completes
+"""
+
+import asyncio
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from api.services.campaign.call_dispatcher import CampaignCallDispatcher
+
+MODULE = "api.services.campaign.call_dispatcher"
+
+
+def make_campaign(processed_rows: int = 5):
+    return SimpleNamespace(
+        id=1,
+        organization_id=10,
+        workflow_id=100,
+        created_by=1000,
+        state="running",
+        rate_limit_per_second=1,
+        processed_rows=processed_rows,
+    )
+
+
+def make_queued_run(queued_run_id: int):
+    return SimpleNamespace(
+        id=queued_run_id,
+        context_variables={"phone_number": f"+1555000{queued_run_id:04d}"},
+    )
+
+
+def make_db_client(campaign, scheduled_runs, regular_runs):
+    db_client = Mock()
+    db_client.get_campaign_by_id = AsyncMock(return_value=campaign)
+    db_client.get_configuration = AsyncMock(return_value=None)
+    db_client.get_scheduled_queued_runs = AsyncMock(return_value=scheduled_runs)
+    db_client.get_queued_runs = AsyncMock(return_value=regular_runs)
+    db_client.get_workflow_by_id = AsyncMock(
+        return_value=SimpleNamespace(template_context_variables={})
+    )
+    db_client.create_workflow_run = AsyncMock(
+        side_effect=lambda **kwargs: SimpleNamespace(
+            id=kwargs["queued_run_id"] * 10, logs={}
+        )
+    )
+    db_client.patch_workflow_run_context = AsyncMock()
+    db_client.update_workflow_run = AsyncMock()
+    db_client.update_queued_run = AsyncMock()
+    db_client.update_campaign = AsyncMock()
+    return db_client
+
+
+def make_rate_limiter():
+    rate_limiter = Mock()
+    slot_ids = iter(f"slot-{i}" for i in range(1, 100))
+    rate_limiter.try_acquire_concurrent_slot = AsyncMock(
+        side_effect=lambda *args: next(slot_ids)
+    )
+    rate_limiter.acquire_token = AsyncMock(return_value=True)
+    rate_limiter.release_concurrent_slot = AsyncMock(return_value=True)
+    rate_limiter.store_workflow_slot_mapping = AsyncMock()
+    rate_limiter.get_workflow_slot_mapping = AsyncMock(return_value=None)
+    return rate_limiter
+
+
+def make_provider(initiate_call):
+    provider = Mock()
+    provider.PROVIDER_NAME = "twilio"
+    provider.WEBHOOK_ENDPOINT = "twiml"
+    provider.initiate_call = initiate_call
+    return provider
+
+
+@contextmanager
+def patch_dispatcher(db_client, rate_limiter, provider):
+    tunnel = Mock()
+    tunnel.get_tunnel_url = AsyncMock(return_value="example.com")
+    with (
+        patch(f"{MODULE}.db_client", db_client),
+        patch(f"{MODULE}.rate_limiter", rate_limiter),
+        patch(f"{MODULE}.get_telephony_provider", AsyncMock(return_value=provider)),
+        patch(f"{MODULE}.TunnelURLProvider", tunnel),
+    ):
+        yield
+
+
+def call_result(call_id: str):
+    return SimpleNamespace(call_id=call_id, provider_metadata={})
+
+
+class TestProcessBatch:
+    """Tests for CampaignCallDispatcher.process_batch."""
+
+    @pytest.mark.asyncio
+    async def test_calls_are_in_flight_concurrently(self):
+        """Provider calls for a batch overlap instead of running one by one."""
+        campaign = make_campaign()
+        runs = [make_queued_run(i) for i in range(1, 4)]
+        db_client = make_db_client(campaign, [], runs)
+        rate_limiter = make_rate_limiter()
+
+        in_flight = 0
+        max_in_flight = 0
+        all_started = asyncio.Event()
+
+        async def initiate_call(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            if in_flight == len(runs):
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            in_flight -= 1
+            return call_result(kwargs["to_number"])
+
+        provider = make_provider(initiate_call)
+        with patch_dispatcher(db_client, rate_limiter, provider):
+            processed = await CampaignCallDispatcher().process_batch(campaign.id)
+
+        assert processed == 3
+        assert max_in_flight == 3
+        assert rate_limiter.acquire_token.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_scheduled_retries_take_slots_first(self):
+        """Slots are handed out in queue order, scheduled retries first."""
+        campaign = make_campaign()
+        scheduled = [make_queued_run(7)]
+        regular = [make_queued_run(1), make_queued_run(2)]
+        db_client = make_db_client(campaign, scheduled, regular)
+        rate_limiter = make_rate_limiter()
+
+        provider = make_provider(AsyncMock(return_value=call_result("call")))
+        with patch_dispatcher(db_client, rate_limiter, provider):
+            await CampaignCallDispatcher().process_batch(campaign.id)
+
+        slot_by_workflow_run = {
+            call.args[0]: call.args[2]
+            for call in rate_limiter.store_workflow_slot_mapping.await_args_list
+        }
+        # Workflow run ids are queued run id * 10
+        assert slot_by_workflow_run == {70: "slot-1", 10: "slot-2", 20: "slot-3"}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_timeout_skips_row(self):
+        """A rate-limit timeout fails the queued run before any workflow run exists."""
+        campaign = make_campaign()
+        runs = [make_queued_run(i) for i in range(1, 4)]
+        db_client = make_db_client(campaign, [], runs)
+        rate_limiter = make_rate_limiter()
+        provider = make_provider(AsyncMock(return_value=call_result("call")))
+
+        dispatcher = CampaignCallDispatcher()
+        dispatcher.apply_rate_limit = AsyncMock(
+            side_effect=[None, TimeoutError("Rate limit timeout"), None]
+        )
+
+        with patch_dispatcher(db_client, rate_limiter, provider):
+            processed = await dispatcher.process_batch(campaign.id)
+
+        assert processed == 2
+
+        created_for = {
+            call.kwargs["queued_run_id"]
+            for call in db_client.create_workflow_run.await_args_list
+        }
+        assert created_for == {1, 3}
+
+        # The slot taken for the skipped row is released
+        rate_limiter.release_concurrent_slot.assert_awaited_once_with(10, "slot-2")
+        failed = [
+            call.kwargs["queued_run_id"]
+            for call in db_client.update_queued_run.await_args_list
+            if call.kwargs["state"] == "failed"
+        ]
+        assert failed == [2]
+
+    @pytest.mark.asyncio
+    async def test_processed_rows_written_per_completed_run(self):
+        """processed_rows grows by one per successful call, failures excluded."""
+        campaign = make_campaign(processed_rows=5)
+        runs = [make_queued_run(i) for i in range(1, 4)]
+        db_client = make_db_client(campaign, [], runs)
+        rate_limiter = make_rate_limiter()
+
+        async def initiate_call(**kwargs):
+            if kwargs["workflow_run_id"] == 20:
+                raise RuntimeError("provider error")
+            return call_result("call")
+
+        provider = make_provider(initiate_call)
+        with patch_dispatcher(db_client, rate_limiter, provider):
+            processed = await CampaignCallDispatcher().process_batch(campaign.id)
+
+        assert processed == 2
+        written = [
+            call.kwargs["processed_rows"]
+            for call in db_client.update_campaign.await_args_list
+        ]
+        assert written == [6, 7]
@@ -0,0 +1,55 @@
+import jwt
+import pytest
+
+from api.services.livekit_service import LiveKitTokenService
+
+
+class TestCreateParticipantToken:
+    """Tokens are signed by hand, so check them against PyJWT."""
+
+    def setup_method(self):
+        self.service = LiveKitTokenService.from_values(
+            api_key="test-key", api_secret="test-secret", url="wss://example.livekit"
+        )
+
+    def test_token_decodes_with_pyjwt(self):
+        """Token is a valid HS256 JWT carrying the participant claims."""
+        token, identity = self.service.create_participant_token(
+            room_name="room-1",
+            identity="agent-1",
+            participant_name="Agent",
+            metadata='{"k":"v"}',
+        )
+
+        assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+
+        claims = jwt.decode(token, "test-secret", algorithms=["HS256"])
+        assert identity == "agent-1"
+        assert claims["iss"] == "test-key"
+        assert claims["sub"] == "agent-1"
+        assert claims["name"] == "Agent"
+        assert claims["metadata"] == '{"k":"v"}'
+        assert claims["video"]["room"] == "room-1"
+        assert claims["video"]["roomJoin"] is True
+        assert claims["exp"] - claims["iat"] == 3600
+
+    def test_token_rejected_with_wrong_secret(self):
+        """Signature is bound to the configured API secret."""
+        token, _ = self.service.create_participant_token(room_name="room-1")
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            jwt.decode(token, "other-secret", algorithms=["HS256"])
+
+    def test_signing_is_repeatable(self):
+        """Reusing the HMAC template does not leak state between tokens."""
+        first, _ = self.service.create_participant_token(room_name="room-1")
+        second, _ = self.service.create_participant_token(room_name="room-2")
+
+        assert (
+            jwt.decode(first, "test-secret", algorithms=["HS256"])["video"]["room"]
+            == "room-1"
+        )
+        assert (
+            jwt.decode(second, "test-secret", algorithms=["HS256"])["video"]["room"]
+            == "room-2"
+        )
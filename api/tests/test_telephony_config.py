@@ -0,0 +1,123 @@
+"""Tests for the in-process telephony configuration cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from api.routes.organization import save_telephony_configuration
+from api.schemas.telephony_config import TwilioConfigurationRequest
+from api.services.telephony import config as telephony_config
+from api.services.telephony.config import (
+    TELEPHONY_CONFIG_CACHE_TTL_SECONDS,
+    load_telephony_config,
+)
+
+ORG_ID = 1
+
+
+def twilio_row(auth_token: str = "token-1"):
+    return SimpleNamespace(
+        value={
+            "provider": "twilio",
+            "account_sid": "AC123",
+            "auth_token": auth_token,
+            "from_numbers": ["+15550000001"],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    telephony_config._config_cache.clear()
+    yield
+    telephony_config._config_cache.clear()
+
+
+@pytest.fixture
+def clock():
+    """Controls time.monotonic as seen by the config module."""
+    mock_time = Mock()
+    mock_time.monotonic.return_value = 1000.0
+    with patch("api.services.telephony.config.time", mock_time):
+        yield mock_time
+
+
+@pytest.fixture
+def db_client():
+    mock_db_client = Mock()
+    mock_db_client.get_configuration = AsyncMock(return_value=twilio_row())
+    mock_db_client.upsert_configuration = AsyncMock()
+    with (
+        patch("api.services.telephony.config.db_client", mock_db_client),
+        patch("api.routes.organization.db_client", mock_db_client),
+    ):
+        yield mock_db_client
+
+
+class TestLoadTelephonyConfig:
+    """Tests for load_telephony_config caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_loads_hit_cache(self, clock, db_client):
+        """Loads within the TTL read the database once."""
+        first = await load_telephony_config(ORG_ID)
+        second = await load_telephony_config(ORG_ID)
+
+        assert first == second
+        assert first["auth_token"] == "token-1"
+        assert db_client.get_configuration.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self, clock, db_client):
+        """Once the TTL passes the config is read from the database again."""
+        await load_telephony_config(ORG_ID)
+
+        db_client.get_configuration.return_value = twilio_row("token-2")
+        clock.monotonic.return_value += TELEPHONY_CONFIG_CACHE_TTL_SECONDS - 1
+        assert (await load_telephony_config(ORG_ID))["auth_token"] == "token-1"
+
+        clock.monotonic.return_value += 2
+        assert (await load_telephony_config(ORG_ID))["auth_token"] == "token-2"
+        assert db_client.get_configuration.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_config_is_a_copy(self, clock, db_client):
+        """Mutating a returned config, including its lists, leaves the cache intact."""
+        config = await load_telephony_config(ORG_ID)
+        config["auth_token"] = "changed"
+        config["from_numbers"].append("+15550000002")
+
+        cached = await load_telephony_config(ORG_ID)
+        assert cached["auth_token"] == "token-1"
+        assert cached["from_numbers"] == ["+15550000001"]
+        assert cached is not config
+
+    @pytest.mark.asyncio
+    async def test_saving_config_invalidates_cache(self, clock, db_client):
+        """Saving through the organization route drops the cached entry."""
+        await load_telephony_config(ORG_ID)
+
+        request = TwilioConfigurationRequest(
+            account_sid="AC123", auth_token="token-2", from_numbers=["+15550000001"]
+        )
+        user = SimpleNamespace(selected_organization_id=ORG_ID)
+        db_client.get_configuration.return_value = None
+        await save_telephony_configuration(request, user)
+
+        db_client.get_configuration.return_value = twilio_row("token-2")
+        config = await load_telephony_config(ORG_ID)
+
+        assert config["auth_token"] == "token-2"
+        db_client.upsert_configuration.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_config_is_not_cached(self, clock, db_client):
+        """A missing configuration raises and is looked up again next time."""
+        db_client.get_configuration.return_value = None
+
+        with pytest.raises(ValueError):
+            await load_telephony_config(ORG_ID)
+
+        db_client.get_configuration.return_value = twilio_row()
+        assert (await load_telephony_config(ORG_ID))["provider"] == "twilio"
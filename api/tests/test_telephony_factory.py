@@ -0,0 +1,116 @@
+"""Tests for per-organization telephony provider caching in the factory."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from api.routes.organization import save_telephony_configuration
+from api.schemas.telephony_config import TwilioConfigurationRequest
+from api.services.telephony import config as telephony_config
+from api.services.telephony import factory
+from api.services.telephony.config import TELEPHONY_CONFIG_CACHE_TTL_SECONDS
+from api.services.telephony.factory import get_telephony_provider
+from api.services.telephony.providers.twilio_provider import TwilioProvider
+
+ORG_ID = 1
+
+
+def twilio_row(auth_token: str = "token-1"):
+    return SimpleNamespace(
+        value={
+            "provider": "twilio",
+            "account_sid": "AC123",
+            "auth_token": auth_token,
+            "from_numbers": ["+15550000001"],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    telephony_config._config_cache.clear()
+    factory._provider_cache.clear()
+    yield
+    telephony_config._config_cache.clear()
+    factory._provider_cache.clear()
+
+
+@pytest.fixture
+def clock():
+    """Controls time.monotonic for both the config cache and the factory."""
+    mock_time = Mock()
+    mock_time.monotonic.return_value = 1000.0
+    with (
+        patch("api.services.telephony.config.time", mock_time),
+        patch("api.services.telephony.factory.time", mock_time),
+    ):
+        yield mock_time
+
+
+@pytest.fixture
+def db_client():
+    mock_db_client = Mock()
+    mock_db_client.get_configuration = AsyncMock(return_value=twilio_row())
+    mock_db_client.upsert_configuration = AsyncMock()
+    with (
+        patch("api.services.telephony.config.db_client", mock_db_client),
+        patch("api.routes.organization.db_client", mock_db_client),
+    ):
+        yield mock_db_client
+
+
+class TestGetTelephonyProvider:
+    """Tests for get_telephony_provider instance reuse."""
+
+    @pytest.mark.asyncio
+    async def test_provider_reused_while_config_unchanged(self, clock, db_client):
+        first = await get_telephony_provider(ORG_ID)
+        second = await get_telephony_provider(ORG_ID)
+
+        assert isinstance(first, TwilioProvider)
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_changed_config_yields_new_provider(self, clock, db_client):
+        """A config change picked up after the config TTL builds a new provider."""
+        first = await get_telephony_provider(ORG_ID)
+
+        db_client.get_configuration.return_value = twilio_row("token-2")
+        telephony_config.invalidate_cached_telephony_config(ORG_ID)
+        second = await get_telephony_provider(ORG_ID)
+
+        assert second is not first
+        assert second.auth_token == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_provider_expires_with_ttl(self, clock, db_client):
+        """An unchanged config still gets a fresh provider once the TTL passes."""
+        first = await get_telephony_provider(ORG_ID)
+
+        clock.monotonic.return_value += TELEPHONY_CONFIG_CACHE_TTL_SECONDS - 1
+        assert await get_telephony_provider(ORG_ID) is first
+
+        clock.monotonic.return_value += 2
+        second = await get_telephony_provider(ORG_ID)
+        assert second is not first
+        assert second.auth_token == first.auth_token
+
+    @pytest.mark.asyncio
+    async def test_saving_config_evicts_provider(self, clock, db_client):
+        """Saving through the organization route drops the cached provider."""
+        first = await get_telephony_provider(ORG_ID)
+
+        request = TwilioConfigurationRequest(
+            account_sid="AC123", auth_token="token-2", from_numbers=["+15550000001"]
+        )
+        user = SimpleNamespace(selected_organization_id=ORG_ID)
+        db_client.get_configuration.return_value = None
+        await save_telephony_configuration(request, user)
+
+        assert ORG_ID not in factory._provider_cache
+
+        db_client.get_configuration.return_value = twilio_row("token-2")
+        second = await get_telephony_provider(ORG_ID)
+        assert second is not first
+        assert second.auth_token == "token-2"
@@ -0,0 +1,37 @@
+"""Tests for the shared telephony HTTP session."""
+
+import asyncio
+
+from api.services.telephony.providers import _http
+
+
+def test_session_replaced_and_closed_when_loop_changes():
+    """A session from a finished event loop is closed, not leaked."""
+
+    async def open_session():
+        return _http.get_session()
+
+    async def reopen_session():
+        session = _http.get_session()
+        # Let the close of the stale session run
+        await asyncio.sleep(0)
+        await _http.close_session()
+        return session
+
+    first = asyncio.run(open_session())
+    second = asyncio.run(reopen_session())
+
+    assert second is not first
+    assert first.closed
+    assert second.closed
+
+
+def test_session_reused_within_a_loop():
+    async def get_twice():
+        try:
+            return _http.get_session(), _http.get_session()
+        finally:
+            await _http.close_session()
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
@@ -0,0 +1,137 @@
+"""Known-answer tests for Vobiz webhook signature verification.
+
+Expected signatures are built the way Vobiz documents them, as a hex
+HMAC-SHA256 of ``timestamp + '.' + body`` keyed with the auth token.
+"""
+
+import hashlib
+import hmac
+import time
+
+import pytest
+
+from api.services.telephony.providers.vobiz_provider import VobizProvider
+
+AUTH_TOKEN = "test-auth-token"
+BODY = '{"CallUUID":"abc-123","CallStatus":"completed"}'
+
+
+def sign(timestamp: str, body: str, auth_token: str = AUTH_TOKEN) -> str:
+    payload = f"{timestamp}.{body}"
+    return hmac.new(
+        auth_token.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+@pytest.fixture
+def provider():
+    return VobizProvider(
+        {"auth_id": "MA_TEST", "auth_token": AUTH_TOKEN, "from_numbers": []}
+    )
+
+
+@pytest.fixture
+def timestamp():
+    return str(int(time.time()))
+
+
+class TestVerifyWebhookSignature:
+    """Tests for VobizProvider.verify_webhook_signature."""
+
+    @pytest.mark.asyncio
+    async def test_valid_signature(self, provider, timestamp):
+        """A signature over the exact timestamp and body is accepted."""
+        signature = sign(timestamp, BODY)
+        assert await provider.verify_webhook_signature(
+            "https://example.com", {}, signature, timestamp, BODY
+        )
+
+    @pytest.mark.asyncio
+    async def test_tampered_body(self, provider, timestamp):
+        """A body changed after signing is rejected."""
+        signature = sign(timestamp, BODY)
+        tampered = BODY.replace("completed", "in-progress")
+        assert not await provider.verify_webhook_signature(
+            "https://example.com", {}, signature, timestamp, tampered
+        )
+
+    @pytest.mark.asyncio
+    async def test_wrong_timestamp(self, provider, timestamp):
+        """A signature made for another timestamp is rejected."""
+        signature = sign(str(int(timestamp) - 1), BODY)
+        assert not await provider.verify_webhook_signature(
+            "https://example.com", {}, signature, timestamp, BODY
+        )
+
+    @pytest.mark.asyncio
+    async def test_wrong_auth_token(self, provider, timestamp):
+        """A signature keyed with another auth token is rejected."""
+        signature = sign(timestamp, BODY, auth_token="other-token")
+        assert not await provider.verify_webhook_signature(
+            "https://example.com", {}, signature, timestamp, BODY
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_timestamp(self, provider):
+        """A correctly signed but stale request is rejected."""
+        stale = str(int(time.time()) - 600)
+        signature = sign(stale, BODY)
+        assert not await provider.verify_webhook_signature(
+            "https://example.com", {}, signature, stale, BODY
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "signature",
+        [
+            "not-a-hex-signature",
+            "abc",  # odd length
+            "zz" * 32,  # right length, not hex
+            "",
+        ],
+    )
+    async def test_malformed_signature_returns_false(
+        self, provider, timestamp, signature
+    ):
+        """Malformed signature headers are rejected without raising."""
+        assert (
+            await provider.verify_webhook_signature(
+                "https://example.com", {}, signature, timestamp, BODY
+            )
+            is False
+        )
+
+    @pytest.mark.asyncio
+    async def test_truncated_signature(self, provider, timestamp):
+        """A valid signature prefix is not accepted."""
+        signature = sign(timestamp, BODY)[:32]
+        assert not await provider.verify_webhook_signature(
+            "https://example.com", {}, signature, timestamp, BODY
+        )
+
+
+class TestVerifyInboundSignature:
+    """Tests for VobizProvider.verify_inbound_signature."""
+
+    @pytest.mark.asyncio
+    async def test_valid_signature(self, provider, timestamp):
+        signature = sign(timestamp, BODY)
+        assert await provider.verify_inbound_signature(
+            "https://example.com", {}, signature, timestamp, BODY
+        )
+
+    @pytest.mark.asyncio
+    async def test_tampered_body(self, provider, timestamp):
+        signature = sign(timestamp, BODY)
+        assert not await provider.verify_inbound_signature(
+            "https://example.com", {}, signature, timestamp, BODY + " "
+        )
+
+    @pytest.mark.asyncio
+    async def test_malformed_signature_returns_false(self, provider, timestamp):
+        assert (
+            await provider.verify_inbound_signature(
+                "https://example.com", {}, "abc", timestamp, BODY
+            )
+            is False
+        )
@@ -3,15 +3,41 @@
 import asyncio
 import os
 import re
+import time
 from typing import Optional
 
 import aiohttp
 from loguru import logger
 
+# How long a URL discovered from cloudflared is reused before querying again
+TUNNEL_URL_CACHE_TTL_SECONDS = 60.0
+
+_USER_HOSTNAME_RE = re.compile(r'userHostname="([^"]+)"')
+_TRYCLOUDFLARE_RE = re.compile(r"([a-z0-9-]+\.trycloudflare\.com)")
+
 
 class TunnelURLProvider:
     """Provider for getting the tunnel URL from cloudflared or environment."""
 
+    _cached_url: Optional[str] = None
+    _cached_until: float = 0.0
+    _lock: Optional[asyncio.Lock] = None
+    _lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """Return the refresh lock, creating it for the running event loop.
+
+        asyncio locks are bound to the loop that first uses them, so a new lock
+        is created whenever the running loop changes (e.g. a test runner or
+        worker starting a fresh loop).
+        """
+        loop = asyncio.get_running_loop()
+        if cls._lock is None or cls._lock_loop is not loop:
+            cls._lock = asyncio.Lock()
+            cls._lock_loop = loop
+        return cls._lock
+
     @classmethod
     async def get_tunnel_url(cls) -> str:
         """
@@ -19,7 +45,8 @@ class TunnelURLProvider:
 
         Priority:
         1. BACKEND_API_ENDPOINT environment variable (if set)
-        2. Query cloudflared metrics endpoint
+        2. Query cloudflared metrics endpoint (cached for
+           TUNNEL_URL_CACHE_TTL_SECONDS; a stale URL is returned if a refresh fails)
         3. Raise error if neither available
 
         Returns:
@@ -34,15 +61,32 @@ class TunnelURLProvider:
             logger.debug(f"Using BACKEND_API_ENDPOINT from environment: {env_endpoint}")
             return env_endpoint
 
-        # Second priority: Query cloudflared
-        try:
-            # Try to get URL from cloudflared metrics
-            url = await cls._get_cloudflared_url()
-            if url:
-                logger.info(f"Retrieved tunnel URL from cloudflared: {url}")
-                return url
-        except Exception as e:
-            logger.warning(f"Failed to get tunnel URL from cloudflared: {e}")
+        # Second priority: Query cloudflared, reusing a recent result
+        if cls._cached_url and cls._cached_until > time.monotonic():
+            return cls._cached_url
+
+        async with cls._get_lock():
+            # Another caller may have refreshed the URL while we waited
+            if cls._cached_url and cls._cached_until > time.monotonic():
+                return cls._cached_url
+
+            try:
+                # Try to get URL from cloudflared metrics
+                url = await cls._get_cloudflared_url()
+                if url:
+                    logger.info(f"Retrieved tunnel URL from cloudflared: {url}")
+                    cls._cached_url = url
+                    cls._cached_until = time.monotonic() + TUNNEL_URL_CACHE_TTL_SECONDS
+                    return url
+            except Exception as e:
+                logger.warning(f"Failed to get tunnel URL from cloudflared: {e}")
+
+            # Fall back to the last known URL rather than failing the call
+            if cls._cached_url:
+                logger.warning(
+                    f"Using stale tunnel URL {cls._cached_url} after cloudflared lookup failed"
+                )
+                return cls._cached_url
 
         raise ValueError(
             "No tunnel URL available. Please set BACKEND_API_ENDPOINT environment "
@@ -76,7 +120,7 @@ class TunnelURLProvider:
 
                     # Look for the tunnel URL in metrics
                     # Cloudflared exposes this in the userHostname metric
-                    match = re.search(r'userHostname="([^"]+)"', text)
+                    match = _USER_HOSTNAME_RE.search(text)
                     if match:
                         hostname = match.group(1)
                         # Remove https:// or wss:// if present
@@ -86,7 +130,7 @@ class TunnelURLProvider:
                         return hostname
 
                     # Alternative: Look for trycloudflare.com domain
-                    match = re.search(r"([a-z0-9-]+\.trycloudflare\.com)", text)
+                    match = _TRYCLOUDFLARE_RE.search(text)
                     if match:
                         return match.group(1)
 